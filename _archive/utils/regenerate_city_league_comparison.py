@@ -6,18 +6,20 @@ Recreates the comparison file from cleaned city_league_archetypes.csv
 
 import csv
 import os
+from pathlib import Path
+
+DATA_DIR = Path(__file__).resolve().parent.parent / 'data'
 
 def get_data_dir():
     """Get the data directory."""
-    return os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data')
+    return str(DATA_DIR)
 
 def build_stats(data):
-    """Build statistics from deck data."""
+    """Build statistics from (archetype, placement) pairs."""
     stats = {}
-    for entry in data:
-        archetype = entry.get('archetype', 'Unknown')
+    for archetype, placement in data:
         try:
-            placement = int(entry.get('placement', 0))
+            placement = int(placement)
         except ValueError:
             placement = 0
         
@@ -45,15 +47,31 @@ def regenerate_comparison():
     csv_file = os.path.join(data_dir, 'city_league_archetypes.csv')
     comparison_csv = os.path.join(data_dir, 'city_league_archetypes_comparison.csv')
     
-    if not os.path.exists(csv_file):
+    try:
+        f = open(csv_file, 'r', encoding='utf-8-sig', newline='', buffering=1 << 20)
+    except FileNotFoundError:
         print(f"❌ CSV file not found: {csv_file}")
         return
     
-    # Load all data
+    # Load all data - only archetype and placement are used, so read plain
+    # rows and pick those two columns by index instead of building a dict per row.
     print(f"Loading data from: {csv_file}")
-    with open(csv_file, 'r', encoding='utf-8-sig') as f:
-        reader = csv.DictReader(f, delimiter=';')
-        all_data = list(reader)
+    with f:
+        reader = csv.reader(f, delimiter=';')
+        header = next(reader, [])
+        # Same defaults as the DictReader version: a missing column reads as
+        # 'Unknown' / 0, blank lines are skipped, short rows padded with ''.
+        a_idx = header.index('archetype') if 'archetype' in header else None
+        p_idx = header.index('placement') if 'placement' in header else None
+        width = len(header)
+        all_data = []
+        for row in reader:
+            if not row:
+                continue
+            if len(row) < width:
+                row += [''] * (width - len(row))
+            all_data.append((row[a_idx] if a_idx is not None else 'Unknown',
+                             row[p_idx] if p_idx is not None else 0))
     
     print(f"Loaded {len(all_data)} entries")
     
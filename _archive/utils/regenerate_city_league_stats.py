@@ -6,10 +6,13 @@ Recreates the deck statistics file from cleaned city_league_archetypes.csv
 
 import csv
 import os
+from pathlib import Path
+
+DATA_DIR = Path(__file__).resolve().parent.parent / 'data'
 
 def get_data_dir():
     """Get the data directory."""
-    return os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data')
+    return str(DATA_DIR)
 
 def regenerate_stats():
     """Regenerate deck statistics from cleaned data."""
@@ -17,79 +20,101 @@ def regenerate_stats():
     csv_file = os.path.join(data_dir, 'city_league_archetypes.csv')
     stats_file = os.path.join(data_dir, 'city_league_archetypes_deck_stats.csv')
     
-    if not os.path.exists(csv_file):
+    # Collect deck statistics as running aggregates (no per-archetype placement lists)
+    deck_data = {}  # {archetype: {'count': int, 'total': int, 'best': int, 'worst': int, 'tournaments': {(date, prefecture, shop, id): None}}}
+    entry_count = 0
+    
+    # Rows are read as plain lists and indexed by column position; columns
+    # missing from the header point at a blank padding cell.
+    try:
+        f = open(csv_file, 'r', encoding='utf-8-sig', newline='')
+    except FileNotFoundError:
         print(f"❌ CSV file not found: {csv_file}")
         return
     
-    # Load all data
     print(f"Loading data from: {csv_file}")
-    with open(csv_file, 'r', encoding='utf-8-sig') as f:
-        reader = csv.DictReader(f, delimiter=';')
-        all_data = list(reader)
-    
-    print(f"Loaded {len(all_data)} entries")
-    
-    # Collect deck statistics
-    deck_data = {}  # {archetype: {'count': int, 'placements': [int, ...], 'tournaments': [str, ...]}}
-    
-    for entry in all_data:
-        archetype = entry.get('archetype', 'Unknown')
-        try:
-            placement = int(entry.get('placement', 0))
-        except ValueError:
-            placement = 0
-        
-        tournament_info = f"{entry.get('date', '')} - {entry.get('prefecture', '')} - {entry.get('shop', '')} (ID: {entry.get('tournament_id', '')})"
+    with f:
+        reader = csv.reader(f, delimiter=';')
+        header = next(reader, [])
+        idx = {name: i for i, name in enumerate(header)}
+        blank = len(header)
+        i_arch, i_place, i_date, i_pref, i_shop, i_tid = (
+            idx.get(name, blank) for name in ('archetype', 'placement', 'date', 'prefecture', 'shop', 'tournament_id')
+        )
         
-        if archetype not in deck_data:
-            deck_data[archetype] = {
-                'count': 0,
-                'placements': [],
-                'tournaments': []
-            }
+        for row in reader:
+            if not row:
+                continue  # blank line; DictReader skipped these too
+            if len(row) <= blank:
+                row.extend([''] * (blank + 1 - len(row)))
+            entry_count += 1
+            archetype = row[i_arch] if i_arch != blank else 'Unknown'
+            try:
+                placement = int(row[i_place] or 0)
+            except ValueError:
+                placement = 0
+            
+            # Dedup on the raw fields; the display string is only built for
+            # unique tournaments when the stats file is written.
+            tournament_info = (row[i_date], row[i_pref], row[i_shop], row[i_tid])
+            
+            deck_info = deck_data.get(archetype)
+            if deck_info is None:
+                deck_data[archetype] = {
+                    'count': 1,
+                    'total': placement,
+                    'best': placement,
+                    'worst': placement,
+                    'tournaments': {tournament_info: None}  # insertion-ordered set
+                }
+                continue
         
-        deck_data[archetype]['count'] += 1
-        deck_data[archetype]['placements'].append(placement)
-        deck_data[archetype]['tournaments'].append(tournament_info)
+            deck_info['count'] += 1
+            deck_info['total'] += placement
+            if placement < deck_info['best']:
+                deck_info['best'] = placement
+            if placement > deck_info['worst']:
+                deck_info['worst'] = placement
+            deck_info['tournaments'][tournament_info] = None
     
-    # Calculate statistics
-    stats_rows = []
-    for archetype, deck_info in deck_data.items():
-        avg_placement = sum(deck_info['placements']) / len(deck_info['placements']) if deck_info['placements'] else 0
-        best_placement = min(deck_info['placements']) if deck_info['placements'] else 0
-        worst_placement = max(deck_info['placements']) if deck_info['placements'] else 0
-        
-        # Format average_placement with comma as decimal separator for German Excel
-        avg_placement_str = str(round(avg_placement, 2)).replace('.', ',')
-        
-        stats_rows.append({
-            'archetype': archetype,
-            'format': 'City League (JP)',
-            'total_appearances': deck_info['count'],
-            'average_placement': avg_placement_str,
-            'best_placement': best_placement,
-            'worst_placement': worst_placement,
-            'tournaments': '; '.join(set(deck_info['tournaments']))  # Unique tournament names
-        })
+    print(f"Loaded {entry_count} entries")
     
-    # Sort by total appearances (most common first)
-    stats_rows.sort(key=lambda x: x['total_appearances'], reverse=True)
+    # Sort archetypes by total appearances (most common first); rows are plain
+    # tuples for csv.writer, turned into dicts only for the return value.
+    ranked = sorted(deck_data.items(), key=lambda item: item[1]['count'], reverse=True)
+    fieldnames = ['archetype', 'format', 'total_appearances', 'average_placement', 'best_placement', 'worst_placement', 'tournaments']
+    rows = [
+        (
+            archetype,
+            'City League (JP)',
+            deck_info['count'],
+            # Format average_placement with comma as decimal separator for German Excel
+            str(round(deck_info['total'] / deck_info['count'], 2)).replace('.', ','),
+            deck_info['best'],
+            deck_info['worst'],
+            '; '.join(  # Unique tournament names, first-seen order
+                f"{date} - {prefecture} - {shop} (ID: {tid})"
+                for date, prefecture, shop, tid in deck_info['tournaments']
+            ),
+        )
+        for archetype, deck_info in ranked
+    ]
     
     # Save to CSV
     print(f"\nSaving statistics to: {stats_file}")
     with open(stats_file, 'w', newline='', encoding='utf-8-sig') as f:
-        fieldnames = ['archetype', 'format', 'total_appearances', 'average_placement', 'best_placement', 'worst_placement', 'tournaments']
-        writer = csv.DictWriter(f, fieldnames=fieldnames, delimiter=';')
-        writer.writeheader()
-        writer.writerows(stats_rows)
+        writer = csv.writer(f, delimiter=';')
+        writer.writerow(fieldnames)
+        writer.writerows(rows)
     
     print(f"✅ Statistics saved successfully!")
     print(f"\nTop 10 Most Common Decks:")
     print("-" * 70)
-    for i, row in enumerate(stats_rows[:10], 1):
-        print(f"{i}. {row['archetype']}: {row['total_appearances']} appearances, avg placement: {row['average_placement']}")
+    for i, row in enumerate(rows[:10], 1):
+        print(f"{i}. {row[0]}: {row[2]} appearances, avg placement: {row[3]}")
     
-    return stats_rows
+    # Same return value as before: one dict per archetype row
+    return [dict(zip(fieldnames, row)) for row in rows]
 
 if __name__ == "__main__":
     try:
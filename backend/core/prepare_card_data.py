@@ -14,11 +14,19 @@ import os
 import re
 import shutil
 import sys
+from collections import namedtuple
+from functools import lru_cache
 from typing import List, Dict
 from card_scraper_shared import get_data_dir, get_app_path, setup_console_encoding, load_set_order, card_sort_key
 
 setup_console_encoding()
 
+# Compact per-card price record; keyed by (set, number) in create_merged_database.
+PriceRow = namedtuple('PriceRow', 'eur_price eur_low last_updated')
+
+def _price_row(p: Dict) -> PriceRow:
+    return PriceRow(p.get('eur_price', ''), p.get('eur_low', ''), p.get('last_updated', ''))
+
 def load_csv(filepath: str) -> List[Dict]:
     cards = []
     if os.path.exists(filepath):
@@ -36,14 +44,18 @@ def load_pokedex() -> Dict[str, int]:
             return json.load(f)
     return {}
 
+_BASE_NAME_DROP = str.maketrans("", "", "\u2019'.")
+_NAME_SUFFIX_RE = re.compile(r'\s+(vstar|vmax|v-union|v|ex|gx|break|star|lv\.x|legend)$')
+_NAME_PREFIX_RE = re.compile(r'^(radiant|shining|galarian|hisuian|alolan|paldean|dark|light|basic)\s+')
+
 def get_base_pokemon_name(name: str) -> str:
     name = name.lower()
     # Entferne bekannte Suffixe (ex, VMAX, GX, etc.)
-    name = re.sub(r'\s+(vstar|vmax|v-union|v|ex|gx|break|star|lv\.x|legend)$', '', name)
+    name = _NAME_SUFFIX_RE.sub('', name)
     # Entferne bekannte Präfixe (Radiant, Galarian, Dark, etc.)
-    name = re.sub(r'^(radiant|shining|galarian|hisuian|alolan|paldean|dark|light|basic)\s+', '', name)
+    name = _NAME_PREFIX_RE.sub('', name)
     # Bereinige Satzzeichen (Mr. Mime -> mr-mime, Farfetch'd -> farfetchd)
-    name = name.replace("\u2019", "").replace("'", "").replace(".", "").strip()
+    name = name.translate(_BASE_NAME_DROP).strip()
     # Leerzeichen zu Bindestrich für exakten PokéAPI-Match (Roaring Moon -> roaring-moon)
     return name.replace(" ", "-")
 
@@ -71,9 +83,8 @@ def create_merged_database():
     backend_prices = os.path.join(data_dir, 'price_data.csv')
     # Load frontend prices first (may be more complete from prior runs)
     for p in load_csv(frontend_prices):
-        key = f"{p.get('set')}_{p.get('number')}"
         if p.get('eur_price'):
-            prices_dict[key] = p
+            prices_dict[(p.get('set'), p.get('number'))] = _price_row(p)
     fe_count = len(prices_dict)
     # Backend prices override when they are newer (latest scrape).
     # Exception: a frontend row carrying eur_low comes from the Cardmarket
@@ -81,24 +92,21 @@ def create_merged_database():
     # overwrite it (would clobber the trend+low pair).
     be_override = 0
     for p in load_csv(backend_prices):
-        key = f"{p.get('set')}_{p.get('number')}"
         if not p.get('eur_price'):
             continue
+        key = (p.get('set'), p.get('number'))
         existing = prices_dict.get(key)
         if not existing:
-            prices_dict[key] = p
+            prices_dict[key] = _price_row(p)
             be_override += 1
-        elif existing.get('eur_low'):
+        elif existing.eur_low:
             continue  # frontend row is from Cardmarket — keep it
-        else:
-            be_ts = p.get('last_updated', '')
-            fe_ts = existing.get('last_updated', '')
-            if be_ts >= fe_ts:
-                prices_dict[key] = p
-                be_override += 1
+        elif p.get('last_updated', '') >= existing.last_updated:
+            prices_dict[key] = _price_row(p)
+            be_override += 1
     print(f"✓ Preise geladen: {len(prices_dict)} Einträge ({fe_count} frontend, {be_override} backend-override)")
-    en_keys = {f"{c.get('set')}_{c.get('number')}" for c in english_cards}
-    jp_to_add = [c for c in japanese_cards if f"{c.get('set')}_{c.get('number')}" not in en_keys]
+    en_keys = {(c.get('set'), c.get('number')) for c in english_cards}
+    jp_to_add = [c for c in japanese_cards if (c.get('set'), c.get('number')) not in en_keys]
 
     # Tag JP-only rows so the frontend can render an honest
     # "Japan-only, no Cardmarket listing" affordance instead of an
@@ -120,12 +128,11 @@ def create_merged_database():
         if 'name' in card and 'name_en' not in card:
             card['name_en'] = card.pop('name')
             
-        key = f"{card.get('set')}_{card.get('number')}"
-        
-        if key in prices_dict:
-            card['eur_price'] = prices_dict[key].get('eur_price', '')
-            card['eur_low'] = prices_dict[key].get('eur_low', '')
-            card['price_last_updated'] = prices_dict[key].get('last_updated', '')
+        pr = prices_dict.get((card.get('set'), card.get('number')))
+        if pr:
+            card['eur_price'] = pr.eur_price
+            card['eur_low'] = pr.eur_low
+            card['price_last_updated'] = pr.last_updated
         else:
             card['eur_price'] = card.get('eur_price', '')
             card['eur_low'] = card.get('eur_low', '')
@@ -497,6 +504,9 @@ def split_tournament_cards(frontend_data):
         'July', 'August', 'September', 'October', 'November', 'December'])}
     _ORDINAL_RE = _re.compile(r'(\d+)(?:st|nd|rd|th)\s+(\w+)\s+(\d{4})', _re.I)
 
+    # Every row of a tournament repeats the same date string; parse each
+    # distinct string once.
+    @lru_cache(maxsize=None)
     def _parse_tournament_date(s):
         if not s:
             return None
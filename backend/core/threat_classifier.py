@@ -175,6 +175,9 @@ COUNTER_TYPE_GATE: Dict[str, Optional[Set[str]]] = {
 # Strings to exclude from rule-text matching — Limitless leaks the
 # illustrator credit into .card-text-section on some pages.
 _NOISE_PREFIXES = ("illus.", "illustrated by", "no.")
+# Only this many leading characters can decide a noise-prefix match, so
+# the rule text is not lowercased in full.
+_NOISE_PREFIX_LEN = max(len(p) for p in _NOISE_PREFIXES)
 
 
 def _gather_text(entry: Mapping[str, Any], scope: str) -> str:
@@ -196,8 +199,7 @@ def _gather_text(entry: Mapping[str, Any], scope: str) -> str:
         for r in entry.get("rules", []) or []:
             if not r:
                 continue
-            low = r.strip().lower()
-            if any(low.startswith(p) for p in _NOISE_PREFIXES):
+            if r.lstrip()[:_NOISE_PREFIX_LEN].lower().startswith(_NOISE_PREFIXES):
                 continue
             parts.append(r)
     return " \n ".join(parts)
@@ -228,13 +230,22 @@ def classify_card(entry: Mapping[str, Any]) -> Dict[str, List[str]]:
 
     card_type = _normalize_card_type(entry.get("card_type", ""))
 
+    # Patterns share a handful of scopes; gather each scope's blob once.
+    blobs: Dict[str, str] = {}
+
+    def blob_for(scope: str) -> str:
+        blob = blobs.get(scope)
+        if blob is None:
+            blob = blobs[scope] = _gather_text(entry, scope)
+        return blob
+
     threats: Set[str] = set()
     for category, patterns in THREAT_PATTERNS.items():
         gate = THREAT_TYPE_GATE.get(category)
         if gate is not None and card_type and card_type not in gate:
             continue
         for regex, scope in patterns:
-            blob = _gather_text(entry, scope)
+            blob = blob_for(scope)
             if blob and regex.search(blob):
                 threats.add(category)
                 break
@@ -247,7 +258,7 @@ def classify_card(entry: Mapping[str, Any]) -> Dict[str, List[str]]:
         if gate is not None and card_type and card_type not in gate:
             continue
         for regex, scope in patterns:
-            blob = _gather_text(entry, scope)
+            blob = blob_for(scope)
             if blob and regex.search(blob):
                 counters.add(category)
                 break
@@ -35,6 +35,10 @@ ENERGY_SYMBOL_MAP = {
     "N": "Dragon", "C": "Colorless",
 }
 
+# Card-URL slug for incomplete cards ("Mr. Mime" -> "mr-mime")
+_SLUG_DROP_RE = re.compile(r"[^a-z0-9\s-]")
+_SLUG_DASHES_RE = re.compile(r"-+")
+
 # LOGGING SETUP
 logger = setup_logging("scraper")
 data_dir = get_data_dir()
@@ -710,8 +714,8 @@ def main():
             if "name" in ic and "name_en" not in ic:
                 ic["name_en"] = ic.pop("name")
             if not ic.get("card_url") and ic.get("name_en") and ic.get("set") and ic.get("number"):
-                slug = re.sub(r"[^a-z0-9\s-]", "", ic["name_en"].lower())
-                slug = re.sub(r"-+", "-", slug.replace(" ", "-")).strip("-")
+                slug = _SLUG_DROP_RE.sub("", ic["name_en"].lower())
+                slug = _SLUG_DASHES_RE.sub("-", slug.replace(" ", "-")).strip("-")
                 ic["card_url"] = f"/cards/{ic['set'].upper()}/{ic['number']}/{slug}"
 
         all_cards = incomplete_cards + en_cards
@@ -146,12 +146,12 @@ def scrape_archetype_icons(settings: Dict[str, Any]) -> List[Tuple[str, List[str
 
 
 # ── Merge strategy ───────────────────────────────────────────────────────────
+_NORMALIZE_DROP = str.maketrans("", "", " -'\u2018\u2019\u201B\u0060\u00B4\u02BC")
+
+
 def _normalize(name: str) -> str:
     """Mirror of JS normalize(): apostrophe + whitespace + hyphen insensitive."""
-    out = (name or "").lower()
-    for ch in [" ", "-", "'", "\u2018", "\u2019", "\u201B", "\u0060", "\u00B4", "\u02BC"]:
-        out = out.replace(ch, "")
-    return out
+    return (name or "").lower().translate(_NORMALIZE_DROP)
 
 
 def _load_existing(path: str) -> Dict[str, Any]:
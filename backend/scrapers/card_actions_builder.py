@@ -19,19 +19,27 @@ Run:
 """
 
 import argparse
+import gzip
 import json
 import os
 import re
+import sqlite3
 import sys
 import time
+import urllib.parse
+import urllib.request
 from pathlib import Path
 
 _SCRIPT_DIR = Path(__file__).parent
 _PROJECT_ROOT = _SCRIPT_DIR.parent.parent
 _DATA_DIR = _PROJECT_ROOT / "data"
+_API_CACHE_PATH = _DATA_DIR / "card_api_cache.sqlite"
 
 TRAINER_TYPES = {"Item", "Supporter", "Tool", "Stadium", "Item/Technical Machine"}
 
+_PRINTS_SPLIT_RE = re.compile(r"[,;]+")
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
 # ---------------------------------------------------------------------------
 # NAME → ACTION MAPPING
 # Each entry: card_name → dict with at least 'action', optionally 'actionParam',
@@ -143,7 +151,7 @@ def build_name_to_prints(cards: list[dict]) -> dict[str, set]:
         primary = f"{c.get('set','')}-{c.get('number','')}".upper().strip("-")
         # Additional prints from international_prints field (comma-separated)
         extras_raw = c.get("international_prints", "") or ""
-        extras = [p.strip().upper() for p in re.split(r"[,;]+", extras_raw) if p.strip()]
+        extras = [p.strip().upper() for p in _PRINTS_SPLIT_RE.split(extras_raw) if p.strip()]
         all_prints = set(extras)
         if primary:
             all_prints.add(primary)
@@ -189,7 +197,7 @@ def build_new_entries(
             print_additions.append((idx, new_prints))
             print(f"  [MERGE] '{card_name}' -> +{len(new_prints)} print(s) into existing entry")
         else:
-            slug = re.sub(r"[^a-z0-9]+", "-", card_name.lower()).strip("-")
+            slug = _SLUG_RE.sub("-", card_name.lower()).strip("-")
             entry = {
                 "id": slug,
                 "cardName": card_name,
@@ -217,30 +225,70 @@ def get_existing_prints(data: dict) -> set[str]:
     return existing
 
 
-def try_enrich_from_api(card_name: str, delay: float = 0.5) -> str | None:
-    """Optionally fetch card text from api.pokemontcg.io."""
+def open_api_cache(refresh: bool = False) -> sqlite3.Connection:
+    """Open the persistent card-text cache (data/card_api_cache.sqlite).
+
+    refresh=True drops every cached answer so all names are re-queried.
+    """
+    conn = sqlite3.connect(_API_CACHE_PATH)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("CREATE TABLE IF NOT EXISTS card_text (name TEXT PRIMARY KEY, text TEXT)")
+    if refresh:
+        conn.execute("DELETE FROM card_text")
+    return conn
+
+
+_next_api_call_at = 0.0
+
+
+def try_enrich_from_api(card_name: str, delay: float = 0.5,
+                        cache: sqlite3.Connection | None = None) -> str | None:
+    """Optionally fetch card text from api.pokemontcg.io.
+
+    With a cache connection, earlier answers are returned without a request or
+    delay. Only found card text is cached: a card the API has not indexed yet
+    (or a failed request) is asked again on the next run.
+    API requests start at least *delay* seconds apart; the time a request
+    takes counts towards that gap.
+    """
+    global _next_api_call_at
+    if cache is not None:
+        row = cache.execute("SELECT text FROM card_text WHERE name = ?", (card_name,)).fetchone()
+        if row is not None:
+            return row[0]
+
+    wait = _next_api_call_at - time.monotonic()
+    if wait > 0:
+        time.sleep(wait)
+    _next_api_call_at = time.monotonic() + delay
+
+    text = None
     try:
-        import urllib.request
-        import urllib.parse
         q = urllib.parse.quote(f'name:"{card_name}" supertype:Trainer')
         url = f"https://api.pokemontcg.io/v2/cards?q={q}&pageSize=1&select=name,rules"
-        req = urllib.request.Request(url, headers={"User-Agent": "TheDipidis/1.0"})
+        req = urllib.request.Request(url, headers={"User-Agent": "TheDipidis/1.0", "Accept-Encoding": "gzip"})
         with urllib.request.urlopen(req, timeout=8) as resp:
-            data = json.loads(resp.read())
+            if resp.headers.get("Content-Encoding") == "gzip":
+                data = json.load(gzip.GzipFile(fileobj=resp))
+            else:
+                data = json.load(resp)
         cards = data.get("data", [])
         if cards and cards[0].get("rules"):
-            return " ".join(cards[0]["rules"])
+            text = " ".join(cards[0]["rules"])
+        if cache is not None and text is not None:
+            cache.execute("INSERT OR REPLACE INTO card_text (name, text) VALUES (?, ?)", (card_name, text))
     except Exception:
         pass
-    finally:
-        time.sleep(delay)
-    return None
+    return text
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="Build/update card_actions.json from local card DB")
     parser.add_argument("--dry-run", action="store_true", help="Preview without writing")
     parser.add_argument("--api", action="store_true", help="Enrich with Pokémon TCG API card text")
+    parser.add_argument("--refresh-api-cache", action="store_true",
+                        help="Ignore cached API answers and re-query every card (with --api)")
     args = parser.parse_args()
 
     actions_path = _DATA_DIR / "card_actions.json"
@@ -269,11 +317,16 @@ def main() -> None:
     # Optional API enrichment
     if args.api and new_entries:
         print("\nFetching card text from Pokemon TCG API ...")
-        for entry in new_entries:
-            text = try_enrich_from_api(entry["cardName"])
-            if text:
-                entry["description"] = text[:200]
-                print(f"  [API]  '{entry['cardName']}': {text[:80]}...")
+        cache = open_api_cache(refresh=args.refresh_api_cache)
+        try:
+            for entry in new_entries:
+                text = try_enrich_from_api(entry["cardName"], cache=cache)
+                if text:
+                    entry["description"] = text[:200]
+                    print(f"  [API]  '{entry['cardName']}': {text[:80]}...")
+        finally:
+            cache.commit()
+            cache.close()
 
     if not new_entries and not print_additions:
         print("\nOK: Nothing new to add - card_actions.json is up to date.")
@@ -8,11 +8,11 @@ Card Price Scraper - Limitless TCG Only (V5)
 """
 
 import csv
-import json
 import os
 import sys
 import time
 import logging
+import threading
 import concurrent.futures
 from datetime import datetime
 
@@ -23,11 +23,23 @@ except ImportError:
     print("FEHLER: Bibliotheken fehlen! pip install beautifulsoup4 requests lxml")
     sys.exit(1)
 
-from card_scraper_shared import setup_console_encoding, get_data_dir, setup_logging, load_settings
+from card_scraper_shared import setup_console_encoding, get_data_dir, setup_logging, load_settings, load_set_order
 
 setup_console_encoding()
 logger = setup_logging("price_scraper")
 
+# One keep-alive session per worker thread: every card page lives on the
+# same host, so later requests reuse the warm TCP/TLS connection.
+_thread_local = threading.local()
+
+
+def _get_session() -> "std_requests.Session":
+    if not hasattr(_thread_local, "session"):
+        session = std_requests.Session()
+        session.headers["User-Agent"] = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+        _thread_local.session = session
+    return _thread_local.session
+
 
 def _load_settings() -> dict:
     return load_settings("card_price_scraper_settings.json", {
@@ -41,20 +53,6 @@ def _load_settings() -> dict:
     })
 
 
-def _load_set_order() -> dict:
-    """Load {set_code: order} from sets.json. Higher = newer."""
-    sets_path = os.path.join(get_data_dir(), "sets.json")
-    if not os.path.isfile(sets_path):
-        return {}
-    try:
-        with open(sets_path, encoding="utf-8") as f:
-            raw = json.load(f)
-        return {str(k): int(v) for k, v in raw.items() if isinstance(v, (int, float))}
-    except Exception as e:
-        logger.warning("Konnte sets.json nicht laden: %s", e)
-        return {}
-
-
 def load_cards_to_update(csv_path: str) -> list:
     if not os.path.isfile(csv_path):
         return []
@@ -84,9 +82,7 @@ def _fetch_single_price(card: dict, base_delay: float) -> dict:
             if card.get("card_url")
             else f"https://limitlesstcg.com/cards/{card['set']}/{card['number']}"
         )
-        resp = std_requests.get(lt_url, timeout=12, headers={
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-        })
+        resp = _get_session().get(lt_url, timeout=12)
         if resp.status_code == 200:
             soup = BeautifulSoup(resp.text, "lxml")
             prints_table = soup.select_one("table.card-prints-versions")
@@ -186,7 +182,7 @@ def scrape_prices(cards: list, settings: dict, csv_path: str) -> list:
     # legacy/legacy-extended sets nobody is buying.
     min_set = (settings.get("min_set") or "").strip()
     if min_set:
-        set_order = _load_set_order()
+        set_order = load_set_order()
         min_order = set_order.get(min_set)
         if min_order is None:
             logger.warning("  -> min_set '%s' nicht in sets.json — Filter inaktiv.", min_set)
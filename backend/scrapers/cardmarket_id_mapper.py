@@ -57,6 +57,17 @@ def get_project_data_dir() -> str:
 MIN_OVERLAP_PCT = 0.80  # ≥80% of our cards must appear in the candidate expansion
 MIN_OVERLAP_ABS = 5     # AND at least 5 cards overlap (so 5/5 = 100% on tiny sets is OK)
 
+# Name/slug normalization runs once per product and card; patterns and the
+# punctuation-dropping table are built once.
+_ATTACK_SUFFIX_RE = re.compile(r'\s*[\[(]')
+_DISAMBIGUATOR_RE = re.compile(r'\s+-\s+')
+_GENDER_SPACE_RE = re.compile(r'\s+([♀♂])')
+_SLUG_DROP_TRANS = str.maketrans('', '', "&'.:")
+_SLUG_SEP_RE = re.compile(r'[\s-]+')  # whitespace and dash runs -> one '-'
+_CARD_NUMBER_RE = re.compile(r'(\d+)([a-zA-Z]*)')
+_SINGLES_SLUG_RE = re.compile(r'/Pokemon/Products/Singles/([^/]+)/')
+_BOOSTER_NAME_RE = re.compile(r'^(.+?) Booster(?:\s|$)')
+
 
 def base_name(name: str) -> str:
     """Reduce a Cardmarket product name to a comparable base form.
@@ -66,23 +77,21 @@ def base_name(name: str) -> str:
     - character-disambiguator suffix: \"Professor's Research - Professor Magnolia\" -> \"Professor's Research\"
     - whitespace around ♀/♂ symbols: 'Nidoran ♀' -> 'Nidoran♀'
     """
-    n = re.split(r'\s*[\[(]', name, maxsplit=1)[0]
-    n = re.split(r'\s+-\s+', n, maxsplit=1)[0]
-    n = re.sub(r'\s+([♀♂])', r'\1', n)
+    n = _ATTACK_SUFFIX_RE.split(name, maxsplit=1)[0]
+    n = _DISAMBIGUATOR_RE.split(n, maxsplit=1)[0]
+    n = _GENDER_SPACE_RE.sub(r'\1', n)
     return n.strip()
 
 
 def normalize_for_slug(s: str) -> str:
     """Normalize free text to a slug used for set-name lookup."""
-    s = s.replace('&', '').replace("'", '').replace('.', '').replace(':', '')
-    s = re.sub(r'\s+', '-', s.strip())
-    s = re.sub(r'-+', '-', s)
-    return s.lower()
+    s = s.translate(_SLUG_DROP_TRANS)
+    return _SLUG_SEP_RE.sub('-', s.strip()).lower()
 
 
 def card_number_sort_key(number: str):
     """Numeric-aware sort: '5' < '10' < '100', and 'TG24' sorts after numeric block."""
-    m = re.match(r'(\d+)([a-zA-Z]*)', str(number))
+    m = _CARD_NUMBER_RE.match(str(number))
     if m:
         return (0, int(m.group(1)), m.group(2))
     return (1, 0, str(number))
@@ -118,7 +127,7 @@ def build_set_to_expansion(cards: list, singles: list, nonsingles: list):
     # 1) extract one slug per set from our cardmarket_url field
     slug_counter = defaultdict(Counter)
     for c in cards:
-        m = re.search(r'/Pokemon/Products/Singles/([^/]+)/', c.get('cardmarket_url', ''))
+        m = _SINGLES_SLUG_RE.search(c.get('cardmarket_url', ''))
         if m:
             # Cardmarket URL slugs are dash-separated; normalize to our canonical form
             raw = m.group(1).replace('-', ' ')
@@ -129,7 +138,7 @@ def build_set_to_expansion(cards: list, singles: list, nonsingles: list):
     slug_to_exp = {}
     for p in nonsingles:
         n = p.get('name', '')
-        m = re.match(r'^(.+?) Booster(?:\s|$)', n)
+        m = _BOOSTER_NAME_RE.match(n)
         if m:
             slug_to_exp.setdefault(normalize_for_slug(m.group(1)), p['idExpansion'])
 
@@ -219,7 +219,7 @@ def _scrape_single_tournament(tournament: dict) -> list:
     # Vermeidet BeautifulSoup tbody-Verschluck-Bug
     table = soup.select_one('table.striped')
     if not table:
-        logger.debug(f"Keine Tabelle gefunden für Turnier {tournament.get('tournament_id', 'unknown')}")
+        logger.debug("Keine Tabelle gefunden für Turnier %s", tournament.get('tournament_id', 'unknown'))
         return results
     
     # Iteriere über ALLE <tr>-Zeilen, überspringe Header-Zeilen
@@ -632,15 +632,14 @@ def main():
         logger.info("Keine Turniere gefunden.")
         return
 
-    # Load existing to skip already scraped tournaments
-    existing_ids = set()
+    # Load existing rows once: they give the already scraped IDs now and are
+    # merged with the new rows after the scrape
+    old_data = []
     output_path = os.path.join(get_data_dir(), settings['output_file'])
     if os.path.exists(output_path):
         with open(output_path, 'r', encoding='utf-8-sig') as f:
-            reader = csv.DictReader(f, delimiter=';')
-            for row in reader:
-                if row.get('tournament_id'):
-                    existing_ids.add(row['tournament_id'])
+            old_data = list(csv.DictReader(f, delimiter=';'))
+    existing_ids = {row['tournament_id'] for row in old_data if row.get('tournament_id')}
 
     new_tournaments = [t for t in tournaments if str(t['tournament_id']) not in existing_ids]
 
@@ -668,11 +667,6 @@ def main():
 
     logger.info("Scraping beendet. %s neue Archetypes gefunden.", len(all_data))
 
-    old_data = []
-    if os.path.exists(output_path):
-        with open(output_path, 'r', encoding='utf-8-sig') as f:
-            old_data = list(csv.DictReader(f, delimiter=';'))
-
     new_data = old_data + all_data
 
     if all_data:
@@ -13,6 +13,7 @@ import os
 import sys
 import json
 import re
+import html as html_module
 import time
 import logging
 import threading
@@ -21,7 +22,7 @@ from datetime import datetime
 from typing import Dict, List, Any, Optional
 
 try:
-    from bs4 import BeautifulSoup
+    from bs4 import BeautifulSoup, SoupStrainer
 except ImportError:
     print("FEHLER: beautifulsoup4 fehlt! pip install beautifulsoup4")
     sys.exit(1)
@@ -37,6 +38,8 @@ from card_scraper_shared import (
     load_scraped_ids,
     save_scraped_ids,
     safe_fetch_html,
+    fetch_page_cached,
+    prune_http_cache,
     slug_to_archetype,
     setup_logging,
     load_settings,
@@ -88,6 +91,11 @@ _SET_CODE_SUFFIX_RE = re.compile(
 )
 _TRAILING_EX_RE = re.compile(r"\s+ex$", re.IGNORECASE)
 
+# Decklist parsing ("4 Iono (PAL 185)", "PAL 185", "/decks/<slug>")
+_CARD_LINE_RE = re.compile(r'^(\d+)\s+(.+?)(?:\s+\(.*?\))?$')
+_SET_TEXT_RE = re.compile(r'([A-Z0-9]+)[\s-]+([0-9]+)', re.IGNORECASE)
+_DECK_SLUG_RE = re.compile(r'/decks/([^"?]+)')
+
 
 def _canonicalize_archetype(raw_name: str) -> str:
     """Return the bare Limitless-style archetype name.
@@ -179,6 +187,11 @@ def _load_settings() -> Dict[str, Any]:
 # ============================================================
 # META LIVE (play.limitlesstcg.com)
 # ============================================================
+# Decklists of both sources are cached on disk for a week: a run re-reading
+# the same lists skips the downloads, and the cache doesn't keep every list
+# ever seen (stale entries are pruned at startup).
+DECKLIST_CACHE_TTL = 7 * 24 * 60 * 60
+
 def _fetch_meta_live_decklist(list_url: str, deck_name: str, deck_slug: str, card_db: CardDatabaseLookup, timeout: int) -> dict:
     """
     Extrahiert Deckliste von play.limitlesstcg.com mit 100%iger Set-Genauigkeit.
@@ -187,7 +200,7 @@ def _fetch_meta_live_decklist(list_url: str, deck_name: str, deck_slug: str, car
     2. <span class="set"> oder <span class="card-set">
     3. Fallback auf CardDB
     """
-    html = safe_fetch_html(list_url, timeout)
+    html = fetch_page_cached(list_url, ttl=DECKLIST_CACHE_TTL, timeout=timeout)
     if not html:
         return None
 
@@ -199,7 +212,7 @@ def _fetch_meta_live_decklist(list_url: str, deck_name: str, deck_slug: str, car
         if not text:
             continue
 
-        match = re.match(r'^(\d+)\s+(.+?)(?:\s+\(.*?\))?$', text)
+        match = _CARD_LINE_RE.match(text)
         if not match:
             continue
 
@@ -223,7 +236,7 @@ def _fetch_meta_live_decklist(list_url: str, deck_name: str, deck_slug: str, car
             set_span = a.find('span', class_=['set', 'card-set']) or (parent.find('span', class_=['set', 'card-set']) if parent else None)
             if set_span:
                 set_text = set_span.get_text(strip=True)
-                set_match = re.match(r'([A-Z0-9]+)[\s-]+([0-9]+)', set_text, re.IGNORECASE)
+                set_match = _SET_TEXT_RE.match(set_text)
                 if set_match:
                     set_code, set_num = set_match.group(1).upper(), set_match.group(2)
 
@@ -253,6 +266,10 @@ def _fetch_meta_live_decklist(list_url: str, deck_name: str, deck_slug: str, car
         }
     return None
 
+# Archetype pages are only read for their decklist links
+_DECKLIST_ANCHORS = SoupStrainer('a', href=re.compile(r'/decklist'))
+
+
 def scrape_limitless_online(settings: dict, card_db: CardDatabaseLookup) -> list:
     config = settings.get("sources", {}).get("limitless_online", {})
     if not config.get("enabled", False):
@@ -285,7 +302,7 @@ def scrape_limitless_online(settings: dict, card_db: CardDatabaseLookup) -> list
         if '/matchups' in href.lower():
             continue
 
-        slug_match = re.search(r'/decks/([^"?]+)', href)
+        slug_match = _DECK_SLUG_RE.search(href)
         if slug_match:
             slug = slug_match.group(1)
             if slug not in seen_slugs:
@@ -296,30 +313,31 @@ def scrape_limitless_online(settings: dict, card_db: CardDatabaseLookup) -> list
     logger.info("%s Archetypes zum Scrapen gefunden.", len(deck_links))
 
     all_decks = []
+    futures = []
 
-    for idx, (slug, url) in enumerate(deck_links, 1):
-        deck_name = _canonicalize_archetype(slug_to_archetype(slug))
-        logger.info("[%s/%s] %s (Sammle Decklisten...)", idx, len(deck_links), deck_name)
-
-        deck_html = safe_fetch_html(url, timeout)
-        if not deck_html:
-            continue
+    # One pool for the whole run: the next archetype page is fetched while
+    # the previous archetype's decklists are still downloading.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for idx, (slug, url) in enumerate(deck_links, 1):
+            deck_name = _canonicalize_archetype(slug_to_archetype(slug))
+            logger.info("[%s/%s] %s (Sammle Decklisten...)", idx, len(deck_links), deck_name)
 
-        dsoup = BeautifulSoup(deck_html, 'lxml')
-        list_hrefs = list(dict.fromkeys([a['href'] for a in dsoup.select('a[href*="/decklist"]')]))[:max_lists_per_deck]
+            deck_html = safe_fetch_html(url, timeout)
+            if not deck_html:
+                continue
 
-        if not list_hrefs:
-            continue
+            dsoup = BeautifulSoup(deck_html, 'lxml', parse_only=_DECKLIST_ANCHORS)
+            list_hrefs = list(dict.fromkeys([a['href'] for a in dsoup.find_all('a')]))[:max_lists_per_deck]
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = [
+            futures.extend(
                 executor.submit(_fetch_meta_live_decklist, f"https://play.limitlesstcg.com{lh}", deck_name, slug, card_db, timeout)
                 for lh in list_hrefs
-            ]
-            for future in concurrent.futures.as_completed(futures):
-                res = future.result()
-                if res:
-                    all_decks.append(res)
+            )
+
+        for future in concurrent.futures.as_completed(futures):
+            res = future.result()
+            if res:
+                all_decks.append(res)
 
     logger.info("Meta Live: %s vollstaendige Decklisten extrahiert.", len(all_decks))
     return all_decks
@@ -327,21 +345,34 @@ def scrape_limitless_online(settings: dict, card_db: CardDatabaseLookup) -> list
 # ============================================================
 # META PLAY! (labs.limitlesstcg.com)
 # ============================================================
-def _fetch_meta_play_decklist(url: str, archetype: str, card_db: CardDatabaseLookup, timeout: int) -> dict:
-    import html as html_module
+# Case-insensitive markers of the embedded decklist JSON script; searched
+# directly instead of lowercasing a copy of every <script> body.
+_POKEMON_MARKER_RE = re.compile(r"pokemon", re.IGNORECASE)
+_MESSAGE_MARKER_RE = re.compile(r"message", re.IGNORECASE)
+_SCRIPT_TAGS = SoupStrainer('script')
+# Curly/backtick/acute apostrophe variants -> plain "'" in one translate pass
+_APOSTROPHE_TRANS = str.maketrans(dict.fromkeys("\u2019\u2018`\u00b4\u02bc", "'"))
+_STANDINGS_ID_RE = re.compile(r'/(\d+)/standings')
+# "April 25–26, 2026" / "April 25, 2026" in the standings page header
+_STANDINGS_DATE_RE = re.compile(
+    r'(\b(?:January|February|March|April|May|June|July|August|September|October|November|December)\b)\s+(\d{1,2})(?:\s*[-\u2013]\s*(?:\w+\s+)?\d{1,2})?[^,\d]*,?\s*(\d{4})'
+)
+
 
-    html = safe_fetch_html(url, timeout)
+def _fetch_meta_play_decklist(url: str, archetype: str, card_db: CardDatabaseLookup, timeout: int) -> dict:
+    html = fetch_page_cached(url, ttl=DECKLIST_CACHE_TTL, timeout=timeout)
     if not html:
         return None
 
-    soup = BeautifulSoup(html, 'lxml')
+    # The decklist lives in an embedded JSON <script>; no other tag is built.
+    soup = BeautifulSoup(html, 'lxml', parse_only=_SCRIPT_TAGS)
     cards = []
 
     for script in soup.find_all('script'):
         content = script.string
         if not content:
             continue
-        if 'pokemon' in content.lower() and 'message' in content.lower():
+        if _POKEMON_MARKER_RE.search(content) and _MESSAGE_MARKER_RE.search(content):
             try:
                 data = json.loads(content)
                 body_data = json.loads(data.get('body', '{}'))
@@ -349,7 +380,10 @@ def _fetch_meta_play_decklist(url: str, archetype: str, card_db: CardDatabaseLoo
 
                 for category in ['pokemon', 'trainer', 'energy']:
                     for c in msg.get(category, []):
-                        name = html_module.unescape(c.get('name', '')).replace("\u2019", "'")
+                        name = c.get('name', '')
+                        if '&' in name:  # entity-free names skip the unescape call
+                            name = html_module.unescape(name)
+                        name = name.translate(_APOSTROPHE_TRANS)
                         count = int(c.get('count', 0))
                         set_code = str(c.get('set', '')).strip().upper()
                         set_num = str(c.get('number', '')).strip()
@@ -404,7 +438,7 @@ def scrape_tournaments(settings: dict, card_db: CardDatabaseLookup) -> list:
         return []
 
     scraped_ids = load_scraped_meta_tournaments()
-    t_ids = sorted(list(set(re.findall(r'/(\d+)/standings', html))), key=int, reverse=True)
+    t_ids = sorted({m.group(1) for m in _STANDINGS_ID_RE.finditer(html)}, key=int, reverse=True)
     new_t_ids = [tid for tid in t_ids if tid not in scraped_ids][:max_tournaments]
 
     logger.info("Zu verarbeitende neue Turniere: %s (uebersprungen: %s)", len(new_t_ids), len(t_ids) - len(new_t_ids))
@@ -447,10 +481,7 @@ def scrape_tournaments(settings: dict, card_db: CardDatabaseLookup) -> list:
             #    2026") past byte ~5000. The old 3000-char window
             #    saw only the SvelteKit scaffolding, not the data.
             header_area = fix_mojibake(t_html[:10000])
-            date_match = re.search(
-                r'(\b(?:January|February|March|April|May|June|July|August|September|October|November|December)\b)\s+(\d{1,2})(?:\s*[-\u2013]\s*(?:\w+\s+)?\d{1,2})?[^,\d]*,?\s*(\d{4})',
-                header_area
-            )
+            date_match = _STANDINGS_DATE_RE.search(header_area)
             if date_match:
                 try:
                     t_date = datetime.strptime(
@@ -546,6 +577,7 @@ def main():
     logger.info("=" * 60)
 
     settings = _load_settings()
+    prune_http_cache()
 
     logger.info("Lade einheitliche Karten-Datenbank...")
     try:
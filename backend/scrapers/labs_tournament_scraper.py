@@ -86,7 +86,7 @@ def _parse_date(raw: str) -> Optional[datetime]:
     #   "February 27\u2013March 1, 2026"    (cross-month \u2014 strip "\u2013March 1")
     # The combined regex tolerates an optional month-name word between
     # the dash and the trailing digits.
-    cleaned = re.sub(r'[\u2013\u2014\-]\s*[A-Za-z]*\s*\d+', '', cleaned_input).strip()
+    cleaned = _DATE_RANGE_TAIL_RE.sub('', cleaned_input).strip()
     cleaned = ' '.join(cleaned.split())
     for fmt in ('%B %d, %Y', '%b %d, %Y', '%B %d %Y', '%b %d %Y'):
         try:
@@ -107,6 +107,16 @@ _DATE_TEXT_RE = re.compile(
     re.I,
 )
 
+# Compiled once; used per tournament link / table row / page title
+_DATE_RANGE_TAIL_RE = re.compile(r'[\u2013\u2014\-]\s*[A-Za-z]*\s*\d+')
+_STANDINGS_HREF_RE = re.compile(r'^/(\d+)/standings')
+_FONT_BOLD_RE = re.compile(r'font-bold')
+_TITLE_MOJIBAKE_TAIL_RE = re.compile(r'\s*[âÂ\x80-\x9f]+\s*$')
+_TITLE_PAGE_PREFIX_RE = re.compile(r'(?:Decks|Standings|Pairings|Metagame):\s*(.+)')
+_HEADER_DATE_RE = re.compile(r'((?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d+(?:[–—\-]\d+)?,\s*\d{4})')
+_RECORD_RE = re.compile(r'(\d+)\s*-\s*(\d+)\s*-\s*(\d+)')
+_DATA_TABLE_CLASS_RE = re.compile(r'data-table')
+
 
 # ── Tournament list ───────────────────────────────────────────────────────────
 
@@ -135,7 +145,7 @@ def scrape_tournament_list(
     # Every tournament is an <a> linking to /XXXX/standings
     for link in soup.select('a[href]'):
         href = link.get('href', '')
-        m = re.match(r'^/(\d+)/standings', href)
+        m = _STANDINGS_HREF_RE.match(href)
         if not m:
             continue
         tournament_id = m.group(1)
@@ -145,7 +155,7 @@ def scrape_tournament_list(
         # "QuerÃ©taro" → "Querétaro", "GdaÅsk" → "Gdańsk") on the index
         # page so the names downstream don't carry the mojibake all the
         # way into the field-card UI.
-        name_el = link.find(attrs={'class': re.compile(r'font-bold')})
+        name_el = link.find(attrs={'class': _FONT_BOLD_RE})
         raw_name = name_el.get_text(strip=True) if name_el else f'Tournament {tournament_id}'
         name = fix_mojibake(raw_name)
 
@@ -256,8 +266,8 @@ def scrape_tournament_meta(tournament_id: str) -> Dict[str, str]:
             # Repeating rstrip handles "Prague â\x80\x93 " ending with
             # whitespace + bytes after the strip.
             head = head.rstrip(' \t–—-â\x80\x93\x94')
-            head = re.sub(r'\s*[âÂ\x80-\x9f]+\s*$', '', head).strip()
-            m = re.match(r'(?:Decks|Standings|Pairings|Metagame):\s*(.+)', head)
+            head = _TITLE_MOJIBAKE_TAIL_RE.sub('', head).strip()
+            m = _TITLE_PAGE_PREFIX_RE.match(head)
             cleaned = (m.group(1).strip() if m else head)
             cleaned = fix_mojibake(cleaned)
             if cleaned:
@@ -271,10 +281,7 @@ def scrape_tournament_meta(tournament_id: str) -> Dict[str, str]:
     # The header strip after the H1 carries the date + player count, e.g.
     # "April 25–26, 2026 • 1370 players". Extract the date portion.
     body_text = soup.get_text(' ', strip=True)[:1500]
-    date_match = re.search(
-        r'((?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d+(?:[–—\-]\d+)?,\s*\d{4})',
-        body_text
-    )
+    date_match = _HEADER_DATE_RE.search(body_text)
     if date_match:
         date_obj = _parse_date(date_match.group(1))
         if date_obj:
@@ -298,7 +305,7 @@ def scrape_tournament_decks(tournament_id: str) -> Tuple[List[Dict], int]:
         logger.warning("  Failed to fetch %s", url)
         return [], 0
 
-    table = soup.find('table', attrs={'class': re.compile(r'data-table')})
+    table = soup.find('table', attrs={'class': _DATA_TABLE_CLASS_RE})
     if not table:
         logger.warning("  No data-table found for tournament %s", tournament_id)
         return [], 0
@@ -341,7 +348,7 @@ def scrape_tournament_decks(tournament_id: str) -> Tuple[List[Dict], int]:
         # ── Cell 4: W-L-T record ──────────────────────────────────────────
         record_text = cells[4].get_text(strip=True)
         wins = losses = ties = 0
-        rm = re.match(r'(\d+)\s*-\s*(\d+)\s*-\s*(\d+)', record_text)
+        rm = _RECORD_RE.match(record_text)
         if rm:
             wins, losses, ties = int(rm.group(1)), int(rm.group(2)), int(rm.group(3))
 
@@ -524,7 +531,7 @@ def scrape_tournament_conversion(tournament_id: str) -> Dict[str, Dict[str, floa
         logger.warning("    Conversion page fetch failed for %s — skipping", tournament_id)
         return {}
 
-    table = soup.find('table', attrs={'class': re.compile(r'data-table')})
+    table = soup.find('table', attrs={'class': _DATA_TABLE_CLASS_RE})
     if not table:
         logger.warning("    No conversion table found for %s", tournament_id)
         return {}
@@ -12,13 +12,14 @@ import os
 import urllib.parse
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import itemgetter
 from typing import List, Dict, Optional, Tuple, Any
 
 from bs4 import BeautifulSoup
 
 from card_scraper_shared import (
     setup_console_encoding, get_app_path, get_data_dir, fetch_page_bs4,
-    setup_logging, load_settings as _shared_load_settings,
+    setup_logging, load_settings as _shared_load_settings, atomic_write_file,
 )
 
 setup_console_encoding()
@@ -40,11 +41,27 @@ DEFAULT_SETTINGS: Dict[str, Any] = {
 }
 
 
+# Row template shared by the best/worst matchup tables in the HTML report. Bound
+# once at import time and filled via str.format_map with each matchup dict.
+_MATCHUP_ROW_TMPL = (
+    '<tr><td><strong>{opponent_deck}</strong></td>'
+    '<td><strong>{win_rate_numeric:.1f}%</strong></td>'
+    '<td>{record} ({total_games} games)</td></tr>'
+)
+_EMPTY: Dict[str, Any] = {}
+_NO_MATCHUP_ROW = '<tr><td colspan="3" style="text-align: center; color: #95a5a6;">No data available</td></tr>'
+
+_META_STATS_RE = re.compile(r"(\d+)\s+tournaments,\s+(\d+)\s+players,\s+(\d+)\s+matches")
+_DECK_HREF_RE = re.compile(r"^/decks/")
+_SCORE_RE = re.compile(r"(\d+)\s*-\s*(\d+)\s*-\s*(\d+)")  # W-L-T
+# Matchup block id: space/hyphen -> "_", apostrophes dropped, in one pass
+_MATCHUP_SLUG_TRANS = str.maketrans({' ': '_', '-': '_', "'": None})
+
+
 def clean_deck_name(deck_name: str) -> str:
     """Clean deck name by removing extra whitespace and HTML artifacts."""
-    deck_name = ' '.join(deck_name.split())
-    deck_name = deck_name.replace('\n', '').replace('\r', '').strip()
-    return deck_name
+    # split() already drops newlines, tabs and leading/trailing whitespace
+    return ' '.join(deck_name.split())
 
 
 def _load_settings() -> Dict[str, Any]:
@@ -83,7 +100,7 @@ def scrape_deck_statistics(
     # Extract meta stats from <p> tag
     for p in soup.find_all("p"):
         text = p.get_text()
-        m = re.search(r"(\d+)\s+tournaments,\s+(\d+)\s+players,\s+(\d+)\s+matches", text)
+        m = _META_STATS_RE.search(text)
         if m:
             meta_stats = {
                 "tournaments": int(m.group(1)),
@@ -104,7 +121,7 @@ def scrape_deck_statistics(
     decks = []
     for row in table.find_all("tr"):
         # Find deck link directly to avoid tbody/td index issues
-        deck_link = row.find("a", href=re.compile(r"^/decks/"))
+        deck_link = row.find("a", href=_DECK_HREF_RE)
         if not deck_link:
             continue
 
@@ -134,7 +151,7 @@ def scrape_deck_statistics(
         win_rate = texts[name_idx + 4]
 
         wins, losses, ties = 0, 0, 0
-        sm = re.match(r"(\d+)\s*-\s*(\d+)\s*-\s*(\d+)", score)
+        sm = _SCORE_RE.match(score)
         if sm:
             wins, losses, ties = int(sm.group(1)), int(sm.group(2)), int(sm.group(3))
 
@@ -283,9 +300,11 @@ def _scrape_single_matchup(
         # Identify score cell by W-L-T pattern
         score_cell = None
         score_idx  = None
+        m = None
         for i, cell in enumerate(cells):
             text = cell.get_text(strip=True)
-            if re.match(r"\d+\s*-\s*\d+\s*-\s*\d+", text):
+            m = _SCORE_RE.match(text)
+            if m:
                 score_cell = text
                 score_idx  = i
                 break
@@ -301,10 +320,7 @@ def _scrape_single_matchup(
         if not opponent_deck or opponent_deck.lower() in ("deck", "opponent", ""):
             continue
 
-        m = re.match(r"(\d+)\s*-\s*(\d+)\s*-\s*(\d+)", score_cell)
-        if not m:
-            continue
-
+        # m is the W-L-T match of score_cell from the search above
         wins   = int(m.group(1))
         losses = int(m.group(2))
         ties   = int(m.group(3))
@@ -707,8 +723,8 @@ def create_comparison_report(old_stats: Dict[str, Any], new_stats: Dict[str, Any
         logger.debug("comparison_data length: %s", len(comparison_data))
         logger.debug("old_stats length: %s", len(old_stats))
         logger.debug("new_stats length: %s", len(new_stats))
-        logger.debug(f"matchup_data: {type(matchup_data)}, {'has data' if matchup_data else 'is None/empty'}")
-        logger.debug(f"deck_lookup: {type(deck_lookup)}, {'has data' if deck_lookup else 'is None/empty'}")
+        logger.debug("matchup_data: %s, %s", type(matchup_data), 'has data' if matchup_data else 'is None/empty')
+        logger.debug("deck_lookup: %s, %s", type(deck_lookup), 'has data' if deck_lookup else 'is None/empty')
         create_html_report(comparison_data, comparison_html, old_stats, new_stats, settings, matchup_data, deck_lookup)
         print(f"HTML comparison report saved to: {comparison_html}")
     except Exception as e:
@@ -847,6 +863,184 @@ def create_deck_list_html(deck_data: List[Dict[str, Any]], output_file: str, dec
     with open(html_path, 'w', encoding='utf-8') as f:
         f.write(html_content)
 
+# Static pieces of the matchup section in create_html_report, written
+# straight to the output file around the per-deck blocks.
+_MATCHUP_SECTION_OPEN = '''
+        <div class="section">
+            <h2>🎯 Matchup Analysis - Top 100 Decks</h2>
+            <p style="color: #7f8c8d; margin-bottom: 20px;">Best and Worst matchups against Top 10 decks · Select opponent deck for detailed matchup</p>
+            
+'''
+
+_MATCHUP_BUCKETS = (
+    ('''            <!-- Top 10 Decks - Expanded by default -->
+            <details open style="margin-bottom: 30px; border: 2px solid #3498db; border-radius: 8px; padding: 15px; background: #ecf7ff;">
+                <summary style="cursor: pointer; font-size: 1.3em; font-weight: bold; color: #2c3e50; padding: 10px; margin: -15px -15px 15px -15px; background: linear-gradient(135deg, #3498db 0%, #2980b9 100%); color: white; border-radius: 6px 6px 0 0;">
+                    🏆 Top 10 Decks (Rank 1-10)
+                </summary>
+''', lambda rank: rank <= 10),
+    ('''            <!-- Rank 11-30 - Collapsed by default -->
+            <details style="margin-bottom: 30px; border: 2px solid #e67e22; border-radius: 8px; padding: 15px; background: #fef5e7;">
+                <summary style="cursor: pointer; font-size: 1.3em; font-weight: bold; color: #2c3e50; padding: 10px; margin: -15px -15px 15px -15px; background: linear-gradient(135deg, #e67e22 0%, #d35400 100%); color: white; border-radius: 6px 6px 0 0;">
+                    📊 Rank 11-30
+                </summary>
+''', lambda rank: 11 <= rank <= 30),
+    ('''            <!-- Rank 31+ - Collapsed by default -->
+            <details style="margin-bottom: 30px; border: 2px solid #95a5a6; border-radius: 8px; padding: 15px; background: #f8f9fa;">
+                <summary style="cursor: pointer; font-size: 1.3em; font-weight: bold; color: #2c3e50; padding: 10px; margin: -15px -15px 15px -15px; background: linear-gradient(135deg, #95a5a6 0%, #7f8c8d 100%); color: white; border-radius: 6px 6px 0 0;">
+                    📋 Rest (Rank 31+)
+                </summary>
+''', lambda rank: rank > 30),
+)
+
+_MATCHUP_SECTION_CLOSE = '''
+        </div>
+        
+        <script>
+        function filterOpponents(input, deckName) {
+            const searchTerm = input.value.toLowerCase();
+            const dropdown = document.getElementById('opponent_dropdown_' + deckName);
+            const options = dropdown.querySelectorAll('.opponent-option');
+            let visibleCount = 0;
+            
+            options.forEach(option => {
+                const text = option.textContent.toLowerCase();
+                if (text.includes(searchTerm)) {
+                    option.style.display = 'block';
+                    visibleCount++;
+                } else {
+                    option.style.display = 'none';
+                }
+            });
+            
+            // Show dropdown if there's input
+            if (searchTerm.length > 0 && visibleCount > 0) {
+                dropdown.style.display = 'block';
+            } else if (searchTerm.length > 0) {
+                dropdown.style.display = 'block';
+            } else {
+                dropdown.style.display = 'none';
+            }
+        }
+        
+        function selectOpponent(element, deckName, opponent) {
+            const input = document.getElementById('opponent_search_' + deckName);
+            const hidden = document.getElementById('opponent_selected_' + deckName);
+            const dropdown = document.getElementById('opponent_dropdown_' + deckName);
+            
+            input.value = opponent;
+            hidden.value = opponent;
+            dropdown.style.display = 'none';
+            
+            showMatchup(opponent, deckName);
+        }
+        
+        function showMatchup(opponent, deckName) {
+            const detailsDiv = document.getElementById('matchup_details_' + deckName);
+            
+            if (!opponent) {
+                detailsDiv.style.display = 'none';
+                return;
+            }
+            
+            const dataVar = 'matchupData_' + deckName;
+            const matchupData = window[dataVar];
+            
+            if (matchupData && matchupData[opponent]) {
+                const data = matchupData[opponent];
+                const wr = data.win_rate_numeric;
+                const color = wr > 50 ? '#27ae60' : wr < 50 ? '#e74c3c' : '#95a5a6';
+                
+                detailsDiv.innerHTML = `
+                    <h4 style="margin-top: 0; color: #2c3e50;">Matchup vs ${opponent}</h4>
+                    <table style="width: 100%; border-collapse: collapse;">
+                        <tr style="background: #ddd;">
+                            <td style="padding: 8px; font-weight: bold;">Win Rate:</td>
+                            <td style="padding: 8px; font-weight: bold; color: ${color}; font-size: 1.4em;">${data.win_rate}</td>
+                        </tr>
+                        <tr>
+                            <td style="padding: 8px;">Record:</td>
+                            <td style="padding: 8px;">${data.record}</td>
+                        </tr>
+                        <tr>
+                            <td style="padding: 8px;">Total Games:</td>
+                            <td style="padding: 8px; font-weight: bold;">${data.total_games}</td>
+                        </tr>
+                    </table>
+                `;
+                detailsDiv.style.display = 'block';
+            }
+        }
+        
+        // Close dropdown when clicking outside
+        document.addEventListener('click', function(event) {
+            const dropdowns = document.querySelectorAll('[id^="opponent_dropdown_"]');
+            dropdowns.forEach(dropdown => {
+                if (!event.target.closest('div[id^="opponent_search_"]') && !dropdown.contains(event.target)) {
+                    dropdown.style.display = 'none';
+                }
+            });
+        });
+        </script>
+'''
+
+
+def _write_matchup_deck(f, deck_name: str, matchups: Dict[str, Any], deck_lookup: Dict[str, Any]) -> None:
+    """Write one deck's matchup block (tables, opponent picker, data script) to ``f``."""
+    slug = deck_name.translate(_MATCHUP_SLUG_TRANS)
+    deck_info = deck_lookup.get(deck_name, _EMPTY)
+    f.write(f"""
+            <div style="margin-bottom: 40px; background: #f8f9fa; padding: 20px; border-radius: 8px;">
+                <h3 style="color: #2c3e50; margin-top: 0;">{html_mod.escape(deck_name)} <span style="font-size: 0.8em; color: #7f8c8d;">(Rank #{deck_info.get('rank', '?')} | Total WR: {deck_info.get('win_rate_numeric', 0):.1f}%, Vs Top20: {matchups.get('positive_vs_top20', 0)}:{matchups.get('negative_vs_top20', 0)})</span></h3>
+                
+                <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 20px;">
+                    <div>
+                        <h4 style="color: #27ae60; margin-bottom: 10px;">✅ Best Matchups</h4>
+                        <table style="box-shadow: none;">
+                            <tr style="background: #d4edda;">
+                                <th style="background: #27ae60;">Opponent</th>
+                                <th style="background: #27ae60;">Win Rate</th>
+                                <th style="background: #27ae60;">Record</th>
+                            </tr>
+                            {''.join(_MATCHUP_ROW_TMPL.format_map(m) for m in (matchups.get('best_matchups') or ())) or _NO_MATCHUP_ROW}
+                        </table>
+                    </div>
+                    
+                    <div>
+                        <h4 style="color: #e74c3c; margin-bottom: 10px;">❌ Worst Matchups</h4>
+                        <table style="box-shadow: none;">
+                            <tr style="background: #f8d7da;">
+                                <th style="background: #e74c3c;">Opponent</th>
+                                <th style="background: #e74c3c;">Win Rate</th>
+                                <th style="background: #e74c3c;">Record</th>
+                            </tr>
+                            {''.join(_MATCHUP_ROW_TMPL.format_map(m) for m in (matchups.get('worst_matchups') or ())) or _NO_MATCHUP_ROW}
+                        </table>
+                    </div>
+                </div>
+                
+                <div style="background: white; padding: 15px; border-radius: 5px; border: 2px solid #3498db; margin-top: 20px;">
+                    <h4 style="margin-top: 0; color: #3498db;">🔍 Select & Analyze Opponent Matchup</h4>
+                    <label for="opponent_search_{slug}" style="display: block; margin-bottom: 8px; font-weight: bold;">Search Opponent:</label>
+                    <div style="position: relative;">
+                        <input type="text" id="opponent_search_{slug}" placeholder="Type to search deck..." style="width: 100%; padding: 10px; border: 2px solid #bbb; border-radius: 4px; font-size: 1em;" oninput="filterOpponents(this, '{slug}')">
+                        <div id="opponent_dropdown_{slug}" style="position: absolute; top: 100%; left: 0; right: 0; background: white; border: 2px solid #bbb; border-top: none; border-radius: 0 0 4px 4px; max-height: 250px; overflow-y: auto; display: none; z-index: 1000;">
+                            {''.join(f"<div class=\"opponent-option\" data-value=\"{html_mod.escape(opponent)}\" onclick=\"selectOpponent(this, '{slug}', '{html_mod.escape(opponent).replace(chr(39), chr(92)+chr(39))}')\" style=\"padding: 10px; cursor: pointer; border-bottom: 1px solid #eee; transition: background 0.2s;\">{html_mod.escape(opponent)}</div>" for opponent in sorted(matchups.get('all_opponent_matchups', dict()).keys()))}
+                        </div>
+                    </div>
+                    <input type="hidden" id="opponent_selected_{slug}" value="">
+                    <div id="matchup_details_{slug}" style="margin-top: 15px; display: none; background: #ecf0f1; padding: 15px; border-radius: 4px;"></div>
+                </div>
+                
+                <script>
+                window.matchupData_{slug} = """)
+    json.dump({k: {'opponent_deck': v.get('opponent_deck'), 'win_rate': v.get('win_rate'), 'win_rate_numeric': v.get('win_rate_numeric'), 'record': v.get('record'), 'total_games': v.get('total_games')} for k, v in matchups.get('all_opponent_matchups', dict()).items()}, f)
+    f.write(""";
+                </script>
+            </div>
+""")
+
+
 def create_html_report(comparison_data: List[Dict[str, Any]], output_file: str, 
                        old_stats: Dict[str, Any], new_stats: Dict[str, Any], settings: Dict[str, Any], matchup_data: Optional[Dict[str, Any]] = None, deck_lookup: Optional[Dict[str, Any]] = None):
     """Create a visually appealing HTML comparison report."""
@@ -944,7 +1138,10 @@ def create_html_report(comparison_data: List[Dict[str, Any]], output_file: str,
     else:
         top10_changes_html = 'No changes'
     
-    html_content = f"""<!DOCTYPE html>
+    # Chunks go to a temp file that replaces the report only once it is
+    # complete, so a failure partway never leaves a truncated page behind.
+    def _write(f):
+        f.write(f"""<!DOCTYPE html>
 <html lang="de">
 <head>
     <meta charset="UTF-8">
@@ -1116,7 +1313,7 @@ def create_html_report(comparison_data: List[Dict[str, Any]], output_file: str,
                     <tr>
                         <td><strong>{deck['deck_name']}</strong></td>
                         <td>#{deck['new_rank']} <span class="rank-change rank-up">(▲ {deck['rank_change']})</span></td>
-                        <td>{deck_lookup.get(deck['deck_name'], dict()).get('win_rate_numeric', 0):.1f}% <span class="{'positive' if deck['winrate_change'] > 0 else 'negative' if deck['winrate_change'] < 0 else 'neutral'}">({deck['winrate_change']:+.2f}%)</span></td>
+                        <td>{deck_lookup.get(deck['deck_name'], _EMPTY).get('win_rate_numeric', 0):.1f}% <span class="{'positive' if deck['winrate_change'] > 0 else 'negative' if deck['winrate_change'] < 0 else 'neutral'}">({deck['winrate_change']:+.2f}%)</span></td>
                     </tr>
                     """ for deck in rank_climbers[:10])}
                 </table>
@@ -1134,311 +1331,30 @@ def create_html_report(comparison_data: List[Dict[str, Any]], output_file: str,
                     <tr>
                         <td><strong>{deck['deck_name']}</strong></td>
                         <td>#{deck['new_rank']} <span class="rank-change rank-down">(▼ {abs(deck['rank_change'])})</span></td>
-                        <td>{deck_lookup.get(deck['deck_name'], dict()).get('win_rate_numeric', 0):.1f}% <span class="{'positive' if deck['winrate_change'] > 0 else 'negative' if deck['winrate_change'] < 0 else 'neutral'}">({deck['winrate_change']:+.2f}%)</span></td>
+                        <td>{deck_lookup.get(deck['deck_name'], _EMPTY).get('win_rate_numeric', 0):.1f}% <span class="{'positive' if deck['winrate_change'] > 0 else 'negative' if deck['winrate_change'] < 0 else 'neutral'}">({deck['winrate_change']:+.2f}%)</span></td>
                     </tr>
                     """ for deck in rank_fallers[:10])}
                 </table>
             </div>
         </div>
-
-        {f'''
-        <div class="section">
-            <h2>🎯 Matchup Analysis - Top 100 Decks</h2>
-            <p style="color: #7f8c8d; margin-bottom: 20px;">Best and Worst matchups against Top 10 decks · Select opponent deck for detailed matchup</p>
-            
-            ''' if matchup_data else ''}
-            
-            {f'''
-            <!-- Top 10 Decks - Expanded by default -->
-            <details open style="margin-bottom: 30px; border: 2px solid #3498db; border-radius: 8px; padding: 15px; background: #ecf7ff;">
-                <summary style="cursor: pointer; font-size: 1.3em; font-weight: bold; color: #2c3e50; padding: 10px; margin: -15px -15px 15px -15px; background: linear-gradient(135deg, #3498db 0%, #2980b9 100%); color: white; border-radius: 6px 6px 0 0;">
-                    🏆 Top 10 Decks (Rank 1-10)
-                </summary>
-                {''.join(f"""
-            <div style="margin-bottom: 40px; background: #f8f9fa; padding: 20px; border-radius: 8px;">
-                <h3 style="color: #2c3e50; margin-top: 0;">{html_mod.escape(deck_name)} <span style="font-size: 0.8em; color: #7f8c8d;">(Rank #{deck_lookup.get(deck_name, dict()).get('rank', '?')} | Total WR: {deck_lookup.get(deck_name, dict()).get('win_rate_numeric', 0):.1f}%, Vs Top20: {matchups.get('positive_vs_top20', 0)}:{matchups.get('negative_vs_top20', 0)})</span></h3>
-                
-                <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 20px;">
-                    <div>
-                        <h4 style="color: #27ae60; margin-bottom: 10px;">✅ Best Matchups</h4>
-                        <table style="box-shadow: none;">
-                            <tr style="background: #d4edda;">
-                                <th style="background: #27ae60;">Opponent</th>
-                                <th style="background: #27ae60;">Win Rate</th>
-                                <th style="background: #27ae60;">Record</th>
-                            </tr>
-                            {''.join(f"""
-                            <tr>
-                                <td><strong>{matchup['opponent_deck']}</strong></td>
-                                <td><strong>{matchup['win_rate_numeric']:.1f}%</strong></td>
-                                <td>{matchup['record']} ({matchup['total_games']} games)</td>
-                            </tr>
-                            """ for matchup in matchups.get('best_matchups', [])) if matchups.get('best_matchups') else '<tr><td colspan="3" style="text-align: center; color: #95a5a6;">No data available</td></tr>'}
-                        </table>
-                    </div>
-                    
-                    <div>
-                        <h4 style="color: #e74c3c; margin-bottom: 10px;">❌ Worst Matchups</h4>
-                        <table style="box-shadow: none;">
-                            <tr style="background: #f8d7da;">
-                                <th style="background: #e74c3c;">Opponent</th>
-                                <th style="background: #e74c3c;">Win Rate</th>
-                                <th style="background: #e74c3c;">Record</th>
-                            </tr>
-                            {''.join(f"""
-                            <tr>
-                                <td><strong>{matchup['opponent_deck']}</strong></td>
-                                <td><strong>{matchup['win_rate_numeric']:.1f}%</strong></td>
-                                <td>{matchup['record']} ({matchup['total_games']} games)</td>
-                            </tr>
-                            """ for matchup in matchups.get('worst_matchups', [])) if matchups.get('worst_matchups') else '<tr><td colspan="3" style="text-align: center; color: #95a5a6;">No data available</td></tr>'}
-                        </table>
-                    </div>
-                </div>
-                
-                <div style="background: white; padding: 15px; border-radius: 5px; border: 2px solid #3498db; margin-top: 20px;">
-                    <h4 style="margin-top: 0; color: #3498db;">🔍 Select & Analyze Opponent Matchup</h4>
-                    <label for="opponent_search_{deck_name.replace(' ', '_').replace(chr(39), '').replace('-', '_')}" style="display: block; margin-bottom: 8px; font-weight: bold;">Search Opponent:</label>
-                    <div style="position: relative;">
-                        <input type="text" id="opponent_search_{deck_name.replace(' ', '_').replace(chr(39), '').replace('-', '_')}" placeholder="Type to search deck..." style="width: 100%; padding: 10px; border: 2px solid #bbb; border-radius: 4px; font-size: 1em;" oninput="filterOpponents(this, '{deck_name.replace(' ', '_').replace(chr(39), '').replace('-', '_')}')">
-                        <div id="opponent_dropdown_{deck_name.replace(' ', '_').replace(chr(39), '').replace('-', '_')}" style="position: absolute; top: 100%; left: 0; right: 0; background: white; border: 2px solid #bbb; border-top: none; border-radius: 0 0 4px 4px; max-height: 250px; overflow-y: auto; display: none; z-index: 1000;">
-                            {''.join(f"<div class=\"opponent-option\" data-value=\"{html_mod.escape(opponent)}\" onclick=\"selectOpponent(this, '{deck_name.replace(' ', '_').replace(chr(39), '').replace('-', '_')}', '{html_mod.escape(opponent).replace(chr(39), chr(92)+chr(39))}')\" style=\"padding: 10px; cursor: pointer; border-bottom: 1px solid #eee; transition: background 0.2s;\">{html_mod.escape(opponent)}</div>" for opponent in sorted(matchups.get('all_opponent_matchups', dict()).keys()))}
-                        </div>
-                    </div>
-                    <input type="hidden" id="opponent_selected_{deck_name.replace(' ', '_').replace(chr(39), '').replace('-', '_')}" value="">
-                    <div id="matchup_details_{deck_name.replace(' ', '_').replace(chr(39), '').replace('-', '_')}" style="margin-top: 15px; display: none; background: #ecf0f1; padding: 15px; border-radius: 4px;"></div>
-                </div>
-                
-                <script>
-                window.matchupData_{deck_name.replace(' ', '_').replace(chr(39), '').replace('-', '_')} = {json.dumps({k: {'opponent_deck': v.get('opponent_deck'), 'win_rate': v.get('win_rate'), 'win_rate_numeric': v.get('win_rate_numeric'), 'record': v.get('record'), 'total_games': v.get('total_games')} for k, v in matchups.get('all_opponent_matchups', dict()).items()})};
-                </script>
-            </div>
-            """ for deck_name, matchups in (sorted([(dn, m) for dn, m in matchup_data.items() if int(deck_lookup.get(dn, dict()).get('rank', 999)) <= 10], key=lambda x: int(deck_lookup.get(x[0], dict()).get('rank', 999))) if matchup_data else []) if deck_name.lower() != 'other')}
-            </details>
-            
-            <!-- Rank 11-30 - Collapsed by default -->
-            <details style="margin-bottom: 30px; border: 2px solid #e67e22; border-radius: 8px; padding: 15px; background: #fef5e7;">
-                <summary style="cursor: pointer; font-size: 1.3em; font-weight: bold; color: #2c3e50; padding: 10px; margin: -15px -15px 15px -15px; background: linear-gradient(135deg, #e67e22 0%, #d35400 100%); color: white; border-radius: 6px 6px 0 0;">
-                    📊 Rank 11-30
-                </summary>
-                {''.join(f"""
-            <div style="margin-bottom: 40px; background: #f8f9fa; padding: 20px; border-radius: 8px;">
-                <h3 style="color: #2c3e50; margin-top: 0;">{html_mod.escape(deck_name)} <span style="font-size: 0.8em; color: #7f8c8d;">(Rank #{deck_lookup.get(deck_name, dict()).get('rank', '?')} | Total WR: {deck_lookup.get(deck_name, dict()).get('win_rate_numeric', 0):.1f}%, Vs Top20: {matchups.get('positive_vs_top20', 0)}:{matchups.get('negative_vs_top20', 0)})</span></h3>
-                
-                <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 20px;">
-                    <div>
-                        <h4 style="color: #27ae60; margin-bottom: 10px;">✅ Best Matchups</h4>
-                        <table style="box-shadow: none;">
-                            <tr style="background: #d4edda;">
-                                <th style="background: #27ae60;">Opponent</th>
-                                <th style="background: #27ae60;">Win Rate</th>
-                                <th style="background: #27ae60;">Record</th>
-                            </tr>
-                            {''.join(f"""
-                            <tr>
-                                <td><strong>{matchup['opponent_deck']}</strong></td>
-                                <td><strong>{matchup['win_rate_numeric']:.1f}%</strong></td>
-                                <td>{matchup['record']} ({matchup['total_games']} games)</td>
-                            </tr>
-                            """ for matchup in matchups.get('best_matchups', [])) if matchups.get('best_matchups') else '<tr><td colspan="3" style="text-align: center; color: #95a5a6;">No data available</td></tr>'}
-                        </table>
-                    </div>
-                    
-                    <div>
-                        <h4 style="color: #e74c3c; margin-bottom: 10px;">❌ Worst Matchups</h4>
-                        <table style="box-shadow: none;">
-                            <tr style="background: #f8d7da;">
-                                <th style="background: #e74c3c;">Opponent</th>
-                                <th style="background: #e74c3c;">Win Rate</th>
-                                <th style="background: #e74c3c;">Record</th>
-                            </tr>
-                            {''.join(f"""
-                            <tr>
-                                <td><strong>{matchup['opponent_deck']}</strong></td>
-                                <td><strong>{matchup['win_rate_numeric']:.1f}%</strong></td>
-                                <td>{matchup['record']} ({matchup['total_games']} games)</td>
-                            </tr>
-                            """ for matchup in matchups.get('worst_matchups', [])) if matchups.get('worst_matchups') else '<tr><td colspan="3" style="text-align: center; color: #95a5a6;">No data available</td></tr>'}
-                        </table>
-                    </div>
-                </div>
-                
-                <div style="background: white; padding: 15px; border-radius: 5px; border: 2px solid #3498db; margin-top: 20px;">
-                    <h4 style="margin-top: 0; color: #3498db;">🔍 Select & Analyze Opponent Matchup</h4>
-                    <label for="opponent_search_{deck_name.replace(' ', '_').replace(chr(39), '').replace('-', '_')}" style="display: block; margin-bottom: 8px; font-weight: bold;">Search Opponent:</label>
-                    <div style="position: relative;">
-                        <input type="text" id="opponent_search_{deck_name.replace(' ', '_').replace(chr(39), '').replace('-', '_')}" placeholder="Type to search deck..." style="width: 100%; padding: 10px; border: 2px solid #bbb; border-radius: 4px; font-size: 1em;" oninput="filterOpponents(this, '{deck_name.replace(' ', '_').replace(chr(39), '').replace('-', '_')}')">
-                        <div id="opponent_dropdown_{deck_name.replace(' ', '_').replace(chr(39), '').replace('-', '_')}" style="position: absolute; top: 100%; left: 0; right: 0; background: white; border: 2px solid #bbb; border-top: none; border-radius: 0 0 4px 4px; max-height: 250px; overflow-y: auto; display: none; z-index: 1000;">
-                            {''.join(f"<div class=\"opponent-option\" data-value=\"{html_mod.escape(opponent)}\" onclick=\"selectOpponent(this, '{deck_name.replace(' ', '_').replace(chr(39), '').replace('-', '_')}', '{html_mod.escape(opponent).replace(chr(39), chr(92)+chr(39))}')\" style=\"padding: 10px; cursor: pointer; border-bottom: 1px solid #eee; transition: background 0.2s;\">{html_mod.escape(opponent)}</div>" for opponent in sorted(matchups.get('all_opponent_matchups', dict()).keys()))}
-                        </div>
-                    </div>
-                    <input type="hidden" id="opponent_selected_{deck_name.replace(' ', '_').replace(chr(39), '').replace('-', '_')}" value="">
-                    <div id="matchup_details_{deck_name.replace(' ', '_').replace(chr(39), '').replace('-', '_')}" style="margin-top: 15px; display: none; background: #ecf0f1; padding: 15px; border-radius: 4px;"></div>
-                </div>
-                
-                <script>
-                window.matchupData_{deck_name.replace(' ', '_').replace(chr(39), '').replace('-', '_')} = {json.dumps({k: {'opponent_deck': v.get('opponent_deck'), 'win_rate': v.get('win_rate'), 'win_rate_numeric': v.get('win_rate_numeric'), 'record': v.get('record'), 'total_games': v.get('total_games')} for k, v in matchups.get('all_opponent_matchups', dict()).items()})};
-                </script>
-            </div>
-            """ for deck_name, matchups in (sorted([(dn, m) for dn, m in matchup_data.items() if 11 <= int(deck_lookup.get(dn, dict()).get('rank', 999)) <= 30], key=lambda x: int(deck_lookup.get(x[0], dict()).get('rank', 999))) if matchup_data else []) if deck_name.lower() != 'other')}
-            </details>
-            
-            <!-- Rank 31+ - Collapsed by default -->
-            <details style="margin-bottom: 30px; border: 2px solid #95a5a6; border-radius: 8px; padding: 15px; background: #f8f9fa;">
-                <summary style="cursor: pointer; font-size: 1.3em; font-weight: bold; color: #2c3e50; padding: 10px; margin: -15px -15px 15px -15px; background: linear-gradient(135deg, #95a5a6 0%, #7f8c8d 100%); color: white; border-radius: 6px 6px 0 0;">
-                    📋 Rest (Rank 31+)
-                </summary>
-                {''.join(f"""
-            <div style="margin-bottom: 40px; background: #f8f9fa; padding: 20px; border-radius: 8px;">
-                <h3 style="color: #2c3e50; margin-top: 0;">{html_mod.escape(deck_name)} <span style="font-size: 0.8em; color: #7f8c8d;">(Rank #{deck_lookup.get(deck_name, dict()).get('rank', '?')} | Total WR: {deck_lookup.get(deck_name, dict()).get('win_rate_numeric', 0):.1f}%, Vs Top20: {matchups.get('positive_vs_top20', 0)}:{matchups.get('negative_vs_top20', 0)})</span></h3>
-                
-                <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 20px;">
-                    <div>
-                        <h4 style="color: #27ae60; margin-bottom: 10px;">✅ Best Matchups</h4>
-                        <table style="box-shadow: none;">
-                            <tr style="background: #d4edda;">
-                                <th style="background: #27ae60;">Opponent</th>
-                                <th style="background: #27ae60;">Win Rate</th>
-                                <th style="background: #27ae60;">Record</th>
-                            </tr>
-                            {''.join(f"""
-                            <tr>
-                                <td><strong>{matchup['opponent_deck']}</strong></td>
-                                <td><strong>{matchup['win_rate_numeric']:.1f}%</strong></td>
-                                <td>{matchup['record']} ({matchup['total_games']} games)</td>
-                            </tr>
-                            """ for matchup in matchups.get('best_matchups', [])) if matchups.get('best_matchups') else '<tr><td colspan="3" style="text-align: center; color: #95a5a6;">No data available</td></tr>'}
-                        </table>
-                    </div>
-                    
-                    <div>
-                        <h4 style="color: #e74c3c; margin-bottom: 10px;">❌ Worst Matchups</h4>
-                        <table style="box-shadow: none;">
-                            <tr style="background: #f8d7da;">
-                                <th style="background: #e74c3c;">Opponent</th>
-                                <th style="background: #e74c3c;">Win Rate</th>
-                                <th style="background: #e74c3c;">Record</th>
-                            </tr>
-                            {''.join(f"""
-                            <tr>
-                                <td><strong>{matchup['opponent_deck']}</strong></td>
-                                <td><strong>{matchup['win_rate_numeric']:.1f}%</strong></td>
-                                <td>{matchup['record']} ({matchup['total_games']} games)</td>
-                            </tr>
-                            """ for matchup in matchups.get('worst_matchups', [])) if matchups.get('worst_matchups') else '<tr><td colspan="3" style="text-align: center; color: #95a5a6;">No data available</td></tr>'}
-                        </table>
-                    </div>
-                </div>
-                
-                <div style="background: white; padding: 15px; border-radius: 5px; border: 2px solid #3498db; margin-top: 20px;">
-                    <h4 style="margin-top: 0; color: #3498db;">🔍 Select & Analyze Opponent Matchup</h4>
-                    <label for="opponent_search_{deck_name.replace(' ', '_').replace(chr(39), '').replace('-', '_')}" style="display: block; margin-bottom: 8px; font-weight: bold;">Search Opponent:</label>
-                    <div style="position: relative;">
-                        <input type="text" id="opponent_search_{deck_name.replace(' ', '_').replace(chr(39), '').replace('-', '_')}" placeholder="Type to search deck..." style="width: 100%; padding: 10px; border: 2px solid #bbb; border-radius: 4px; font-size: 1em;" oninput="filterOpponents(this, '{deck_name.replace(' ', '_').replace(chr(39), '').replace('-', '_')}')">
-                        <div id="opponent_dropdown_{deck_name.replace(' ', '_').replace(chr(39), '').replace('-', '_')}" style="position: absolute; top: 100%; left: 0; right: 0; background: white; border: 2px solid #bbb; border-top: none; border-radius: 0 0 4px 4px; max-height: 250px; overflow-y: auto; display: none; z-index: 1000;">
-                            {''.join(f"<div class=\"opponent-option\" data-value=\"{html_mod.escape(opponent)}\" onclick=\"selectOpponent(this, '{deck_name.replace(' ', '_').replace(chr(39), '').replace('-', '_')}', '{html_mod.escape(opponent).replace(chr(39), chr(92)+chr(39))}')\" style=\"padding: 10px; cursor: pointer; border-bottom: 1px solid #eee; transition: background 0.2s;\">{html_mod.escape(opponent)}</div>" for opponent in sorted(matchups.get('all_opponent_matchups', dict()).keys()))}
-                        </div>
-                    </div>
-                    <input type="hidden" id="opponent_selected_{deck_name.replace(' ', '_').replace(chr(39), '').replace('-', '_')}" value="">
-                    <div id="matchup_details_{deck_name.replace(' ', '_').replace(chr(39), '').replace('-', '_')}" style="margin-top: 15px; display: none; background: #ecf0f1; padding: 15px; border-radius: 4px;"></div>
-                </div>
-                
-                <script>
-                window.matchupData_{deck_name.replace(' ', '_').replace(chr(39), '').replace('-', '_')} = {json.dumps({k: {'opponent_deck': v.get('opponent_deck'), 'win_rate': v.get('win_rate'), 'win_rate_numeric': v.get('win_rate_numeric'), 'record': v.get('record'), 'total_games': v.get('total_games')} for k, v in matchups.get('all_opponent_matchups', dict()).items()})};
-                </script>
-            </div>
-            """ for deck_name, matchups in (sorted([(dn, m) for dn, m in matchup_data.items() if int(deck_lookup.get(dn, dict()).get('rank', 999)) > 30], key=lambda x: int(deck_lookup.get(x[0], dict()).get('rank', 999))) if matchup_data else []) if deck_name.lower() != 'other')}
-            </details>
-        </div>
-        
-        <script>
-        function filterOpponents(input, deckName) {{
-            const searchTerm = input.value.toLowerCase();
-            const dropdown = document.getElementById('opponent_dropdown_' + deckName);
-            const options = dropdown.querySelectorAll('.opponent-option');
-            let visibleCount = 0;
-            
-            options.forEach(option => {{
-                const text = option.textContent.toLowerCase();
-                if (text.includes(searchTerm)) {{
-                    option.style.display = 'block';
-                    visibleCount++;
-                }} else {{
-                    option.style.display = 'none';
-                }}
-            }});
-            
-            // Show dropdown if there's input
-            if (searchTerm.length > 0 && visibleCount > 0) {{
-                dropdown.style.display = 'block';
-            }} else if (searchTerm.length > 0) {{
-                dropdown.style.display = 'block';
-            }} else {{
-                dropdown.style.display = 'none';
-            }}
-        }}
-        
-        function selectOpponent(element, deckName, opponent) {{
-            const input = document.getElementById('opponent_search_' + deckName);
-            const hidden = document.getElementById('opponent_selected_' + deckName);
-            const dropdown = document.getElementById('opponent_dropdown_' + deckName);
-            
-            input.value = opponent;
-            hidden.value = opponent;
-            dropdown.style.display = 'none';
-            
-            showMatchup(opponent, deckName);
-        }}
-        
-        function showMatchup(opponent, deckName) {{
-            const detailsDiv = document.getElementById('matchup_details_' + deckName);
-            
-            if (!opponent) {{
-                detailsDiv.style.display = 'none';
-                return;
-            }}
-            
-            const dataVar = 'matchupData_' + deckName;
-            const matchupData = window[dataVar];
-            
-            if (matchupData && matchupData[opponent]) {{
-                const data = matchupData[opponent];
-                const wr = data.win_rate_numeric;
-                const color = wr > 50 ? '#27ae60' : wr < 50 ? '#e74c3c' : '#95a5a6';
-                
-                detailsDiv.innerHTML = `
-                    <h4 style="margin-top: 0; color: #2c3e50;">Matchup vs ${{opponent}}</h4>
-                    <table style="width: 100%; border-collapse: collapse;">
-                        <tr style="background: #ddd;">
-                            <td style="padding: 8px; font-weight: bold;">Win Rate:</td>
-                            <td style="padding: 8px; font-weight: bold; color: ${{color}}; font-size: 1.4em;">${{data.win_rate}}</td>
-                        </tr>
-                        <tr>
-                            <td style="padding: 8px;">Record:</td>
-                            <td style="padding: 8px;">${{data.record}}</td>
-                        </tr>
-                        <tr>
-                            <td style="padding: 8px;">Total Games:</td>
-                            <td style="padding: 8px; font-weight: bold;">${{data.total_games}}</td>
-                        </tr>
-                    </table>
-                `;
-                detailsDiv.style.display = 'block';
-            }}
-        }}
-        
-        // Close dropdown when clicking outside
-        document.addEventListener('click', function(event) {{
-            const dropdowns = document.querySelectorAll('[id^="opponent_dropdown_"]');
-            dropdowns.forEach(dropdown => {{
-                if (!event.target.closest('div[id^="opponent_search_"]') && !dropdown.contains(event.target)) {{
-                    dropdown.style.display = 'none';
-                }}
-            }});
-        }});
-        </script>
-        ''' if matchup_data else ''}
-
+""")
+        if matchup_data:
+            f.write(_MATCHUP_SECTION_OPEN)
+            # Parse each deck's rank once; sorting on the rank alone is stable, so
+            # equal-ranked decks keep their matchup_data order.
+            ranked = sorted(
+                ((int(deck_lookup.get(dn, _EMPTY).get('rank', 999)), dn, m)
+                 for dn, m in matchup_data.items() if dn.lower() != 'other'),
+                key=itemgetter(0),
+            )
+            for bucket_open, in_bucket in _MATCHUP_BUCKETS:
+                f.write(bucket_open)
+                for rank, deck_name, matchups in ranked:
+                    if in_bucket(rank):
+                        _write_matchup_deck(f, deck_name, matchups, deck_lookup)
+                f.write('            </details>\n')
+            f.write(_MATCHUP_SECTION_CLOSE)
+        f.write(f"""
         <div class="section">
             <h2>📋 Full Comparison Table</h2>
             <table>
@@ -1453,17 +1369,16 @@ def create_html_report(comparison_data: List[Dict[str, Any]], output_file: str,
                     <td><strong>{deck['deck_name']}</strong></td>
                     <td>{deck['new_rank']} {f'<span class="rank-change rank-up">(▲{deck["rank_change"]})</span>' if deck['rank_change'] > 0 else f'<span class="rank-change rank-down">(▼{abs(deck["rank_change"])})</span>' if deck['rank_change'] < 0 else '(-)'}</td>
                     <td>{deck['new_count']} <span class="{'positive' if deck['count_change'] > 0 else 'negative' if deck['count_change'] < 0 else 'neutral'}">({deck['count_change']:+d})</span></td>
-                    <td>{deck_lookup.get(deck['deck_name'], dict()).get('win_rate_numeric', 0):.1f}% <span class="{'positive' if deck['winrate_change'] > 0 else 'negative' if deck['winrate_change'] < 0 else 'neutral'}">({deck['winrate_change']:+.2f}%)</span></td>
+                    <td>{deck_lookup.get(deck['deck_name'], _EMPTY).get('win_rate_numeric', 0):.1f}% <span class="{'positive' if deck['winrate_change'] > 0 else 'negative' if deck['winrate_change'] < 0 else 'neutral'}">({deck['winrate_change']:+.2f}%)</span></td>
                 </tr>
                 """ for deck in comparison_data[:50])}
             </table>
         </div>
     </div>
 </body>
-</html>"""
-    
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+</html>""")
+
+    atomic_write_file(output_file, _write, newline=None, buffering=1 << 20)
 
 def print_comparison_summary(comparison_data: List[Dict[str, Any]]):
     """Print a summary of the comparison to console."""
@@ -158,6 +158,20 @@ _ENGLISH_MONTHS = {
 }
 _MONTHS = {**_GERMAN_MONTHS, **_ENGLISH_MONTHS}
 
+_ISO_DATE_RE = re.compile(r"^(\d{4})-(\d{1,2})-(\d{1,2})")
+_GERMAN_DATE_RE = re.compile(r"^(\d{1,2})\.\s*([A-Za-zÄÖÜäöüß]+)\.?\s+(\d{4})")
+_ENGLISH_DATE_RE = re.compile(r"^(\d{1,2})(?:st|nd|rd|th)?\s+([A-Za-z]+)\s+(\d{4})", re.IGNORECASE)
+
+# History-row and decklist link/cell patterns
+_TOURNAMENT_ID_RE = re.compile(r"/tournament/([^/?]+)")
+_PLACE_RE = re.compile(r"^\d+(st|nd|rd|th)\s+of\s+\d+", re.IGNORECASE)
+_SCORE_RE = re.compile(r"^\d+\s*-\s*\d+\s*-\s*\d+\s*$")
+_PLAYER_DECKLIST_RE = re.compile(r"/tournament/([^/?]+)/player/([^/?]+)/decklist")
+_LEGACY_DECK_LIST_RE = re.compile(r"/decks/([^/?]+)/([^/?]+)")
+_LEGACY_DECKLIST_ID_RE = re.compile(r"/decklist[s]?/([^/?]+)")
+_DECK_SLUG_RE = re.compile(r"/decks/([^/?]+)")
+_CARD_LINE_RE = re.compile(r"^(\d+)\s+(.+?)(?:\s+\(.*?\))?$")
+
 
 def _parse_date(text: str) -> Optional[str]:
     """Return ``YYYY-MM-DD`` for any of the date strings Limitless
@@ -170,7 +184,7 @@ def _parse_date(text: str) -> Optional[str]:
         return None
 
     # 1. ISO already
-    iso_match = re.match(r"^(\d{4})-(\d{1,2})-(\d{1,2})", s)
+    iso_match = _ISO_DATE_RE.match(s)
     if iso_match:
         try:
             return datetime(int(iso_match.group(1)), int(iso_match.group(2)),
@@ -179,7 +193,7 @@ def _parse_date(text: str) -> Optional[str]:
             pass
 
     # 2. German "02. Mai 2026" or "25. April 2026"
-    de_match = re.match(r"^(\d{1,2})\.\s*([A-Za-zÄÖÜäöüß]+)\.?\s+(\d{4})", s)
+    de_match = _GERMAN_DATE_RE.match(s)
     if de_match:
         day = int(de_match.group(1))
         mon_key = de_match.group(2).lower().replace(".", "")
@@ -191,7 +205,7 @@ def _parse_date(text: str) -> Optional[str]:
                 pass
 
     # 3. English ordinal "25th April 2026" / "2nd May 2026"
-    en_match = re.match(r"^(\d{1,2})(?:st|nd|rd|th)?\s+([A-Za-z]+)\s+(\d{4})", s, re.IGNORECASE)
+    en_match = _ENGLISH_DATE_RE.match(s)
     if en_match:
         day = int(en_match.group(1))
         mon_key = en_match.group(2).lower()
@@ -237,7 +251,7 @@ def _parse_history_row(tr) -> Optional[Dict[str, str]]:
         if "/player/" in href:
             continue
         tournament_name = a.get_text(" ", strip=True)
-        m = re.search(r"/tournament/([^/?]+)", href)
+        m = _TOURNAMENT_ID_RE.search(href)
         if m:
             tournament_id = m.group(1)
         break
@@ -280,9 +294,9 @@ def _parse_history_row(tr) -> Optional[Dict[str, str]]:
     score = ""
     for c in cells:
         t = c.get_text(" ", strip=True)
-        if re.match(r"^\d+(st|nd|rd|th)\s+of\s+\d+", t, re.IGNORECASE):
+        if _PLACE_RE.match(t):
             place = t
-        elif re.match(r"^\d+\s*-\s*\d+\s*-\s*\d+\s*$", t):
+        elif _SCORE_RE.match(t):
             score = t
 
     # List link — Limitless's per-deck URL changed mid-2026:
@@ -295,7 +309,7 @@ def _parse_history_row(tr) -> Optional[Dict[str, str]]:
     deck_slug_id = ""
     for a in tr.select('a[href*="/decklist"]'):
         href = a.get("href", "")
-        m = re.search(r"/tournament/([^/?]+)/player/([^/?]+)/decklist", href)
+        m = _PLAYER_DECKLIST_RE.search(href)
         if m:
             # Use the player handle as the dedup key — unique within a
             # tournament. The full state-key is `tid|deck_slug_id` so
@@ -306,12 +320,12 @@ def _parse_history_row(tr) -> Optional[Dict[str, str]]:
     if not list_url:
         for a in tr.select('a[href*="/decks/"]'):
             href = a.get("href", "")
-            m = re.search(r"/decks/([^/?]+)/([^/?]+)", href)
+            m = _LEGACY_DECK_LIST_RE.search(href)
             if m:
                 deck_slug_id = f"{m.group(1)}/{m.group(2)}"
                 list_url = href
                 break
-            m = re.search(r"/decklist[s]?/([^/?]+)", href)
+            m = _LEGACY_DECKLIST_ID_RE.search(href)
             if m:
                 deck_slug_id = f"decklist/{m.group(1)}"
                 list_url = href
@@ -376,7 +390,7 @@ def _extract_cards_from_decklist(list_url: str, card_db: CardDatabaseLookup,
         text = a.get_text(strip=True)
         if not text:
             continue
-        m = re.match(r"^(\d+)\s+(.+?)(?:\s+\(.*?\))?$", text)
+        m = _CARD_LINE_RE.match(text)
         if not m:
             continue
         try:
@@ -553,7 +567,7 @@ def list_archetype_slugs(fmt: str, rotation: str, set_code: str,
         href = a.get("href", "")
         if "/matchups" in href.lower():
             continue
-        m = re.search(r"/decks/([^/?]+)", href)
+        m = _DECK_SLUG_RE.search(href)
         if m:
             slug = m.group(1)
             if slug and slug not in seen:
@@ -44,6 +44,7 @@ import re
 import sys
 import time
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Optional, Tuple, Any
 
@@ -61,6 +62,7 @@ from card_scraper_shared import (  # noqa: E402
     fetch_page_bs4,
     load_settings,
     get_data_dir,
+    RequestPacer,
 )
 
 # Phase-3 archetype canonicalisation — graceful fallback if the icons
@@ -79,6 +81,9 @@ logger = setup_logging("online_tournament_scraper")
 BASE_URL = "https://play.limitlesstcg.com"
 LISTING_PATH = "/tournaments/completed"
 STANDINGS_PATH_TPL = "/tournament/{tid}/standings"
+# Standings pages download on a few workers, but request starts stay
+# `delay_between_requests` apart across all of them.
+STANDINGS_IN_FLIGHT = 3
 
 DEFAULT_SETTINGS: Dict[str, Any] = {
     "format_filter": "PFL",
@@ -99,6 +104,11 @@ ICON_URL_PATTERN = re.compile(
     r"r2\.limitlesstcg\.net/pokemon/gen9/([a-z0-9\-]+)\.png", re.IGNORECASE
 )
 
+# Listing/standings parsing, compiled once instead of per table row
+_TOURNAMENT_PAGE_HREF_RE = re.compile(r"/tournament/[^/]+/(standings|details)")
+_TOURNAMENT_ID_RE = re.compile(r"/tournament/([^/]+)/")
+_WINRATE_RE = re.compile(r"(-?\d+(?:\.\d+)?)\s*%?")
+
 # Format filter flows through to the URL ?format= query parameter.
 # Limitless treats the value case-insensitively but lowercase is what
 # the live site shows in its querystrings.
@@ -147,11 +157,11 @@ def _fetch_listing_page(format_filter: str, page: int) -> List[Dict[str, Any]]:
         # Date cell holds the link to the tournament + data-time epoch.
         link = cells[1].find("a", class_="date") if len(cells) > 1 else None
         if not link:
-            link = row.find("a", href=re.compile(r"/tournament/[^/]+/(standings|details)"))
+            link = row.find("a", href=_TOURNAMENT_PAGE_HREF_RE)
         if not link:
             continue
         href = link.get("href", "")
-        m = re.search(r"/tournament/([^/]+)/", href)
+        m = _TOURNAMENT_ID_RE.search(href)
         if not m:
             continue
         tid = m.group(1)
@@ -220,7 +230,7 @@ def _parse_winrate(text: str) -> Optional[float]:
     None for blank / "-" cells."""
     if not text:
         return None
-    m = re.search(r"(-?\d+(?:\.\d+)?)\s*%?", text.replace(",", "."))
+    m = _WINRATE_RE.search(text.replace(",", "."))
     if not m:
         return None
     try:
@@ -321,23 +331,38 @@ def _tournament_weight(date: Optional[datetime], settings: Dict[str, Any]) -> fl
     return float(settings.get("older_weight", 0.5))
 
 
+def _fetch_standings_paced(tid: str, pacer: RequestPacer) -> List[Dict[str, Any]]:
+    """_fetch_standings, with request starts spaced by `pacer` across workers."""
+    pacer.wait()
+    return _fetch_standings(tid)
+
+
 def aggregate(tournaments: List[Dict[str, Any]],
               settings: Dict[str, Any]) -> List[Dict[str, Any]]:
     """Walk the tournament rows, return per-archetype aggregate stats."""
-    delay = float(settings.get("delay_between_requests", 1.5))
+    pacer = RequestPacer(float(settings.get("delay_between_requests", 1.5)))
+    pool = ThreadPoolExecutor(max_workers=STANDINGS_IN_FLIGHT)
+    try:
+        # map() yields in tournament order while later pages are in flight
+        standings = pool.map(lambda t: _fetch_standings_paced(t["id"], pacer), tournaments)
+        return _aggregate_standings(tournaments, standings, settings)
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _aggregate_standings(tournaments: List[Dict[str, Any]], standings,
+                         settings: Dict[str, Any]) -> List[Dict[str, Any]]:
     stats: Dict[str, Dict[str, Any]] = {}
 
-    for i, t in enumerate(tournaments, 1):
+    for i, (t, rows) in enumerate(zip(tournaments, standings), 1):
         weight = _tournament_weight(t.get("date"), settings)
         date_iso = t["date"].isoformat() if t.get("date") else ""
         logger.info(
             "[%d/%d] standings %s (%d players, weight %.2f, %s)",
             i, len(tournaments), t["id"], t["players"], weight, date_iso[:10],
         )
-        rows = _fetch_standings(t["id"])
         if not rows:
             logger.warning("  empty standings — skipping")
-            time.sleep(delay)
             continue
         for r in rows:
             arch = r["archetype"]
@@ -368,7 +393,6 @@ def aggregate(tournaments: List[Dict[str, Any]],
                 cur = entry["last_seen_date"]
                 if cur is None or tdate > cur:
                     entry["last_seen_date"] = tdate
-        time.sleep(delay)
 
     # Finalise into list with conv-rates + last-seen string.
     out: List[Dict[str, Any]] = []
@@ -99,15 +99,22 @@ NON_POKEMON_TYPES = {
     'Basic Energy', 'Special Energy', 'Energy',
 }
 
+# Compiled once; applied to every text node of every card page
+_WS_RE = re.compile(r'\s+')
+_ATTACK_INFO_RE = re.compile(r'^(.+?)\s+(\d+\s*[+×x*]?)\s*$', re.UNICODE)
+_HP_RE = re.compile(r'(\d+)')
+_ABILITY_PREFIX_RE = re.compile(r'^(?:Ability|Pok[ée]-?Power|Pok[ée]-?Body)\s*:\s*(.+)$',
+                                re.IGNORECASE | re.DOTALL)
+
 
 def _norm_ws(text: str) -> str:
-    return re.sub(r'\s+', ' ', text or '').strip()
+    return _WS_RE.sub(' ', text or '').strip()
 
 
 def _split_attack_info(text: str) -> Tuple[str, str]:
     """Given an attack-info line like "Dragon Headbutt 70+", return
     (attack_name, damage). Damage may be empty ("Lock On" has no damage)."""
-    m = re.match(r'^(.+?)\s+(\d+\s*[+×x*]?)\s*$', text or '', re.UNICODE)
+    m = _ATTACK_INFO_RE.match(text or '')
     if m:
         return _norm_ws(m.group(1)), _norm_ws(m.group(2))
     return _norm_ws(text), ''
@@ -162,7 +169,7 @@ def extract_card_effects(soup, fallback_type: str = '') -> Dict[str, Any]:
         if len(parts) >= 3:
             out['card_type'] = 'Pokemon'
             out['energy_type'] = parts[1]
-            hp_match = re.search(r'(\d+)', parts[2])
+            hp_match = _HP_RE.search(parts[2])
             if hp_match:
                 out['hp'] = hp_match.group(1)
         elif len(parts) == 2:
@@ -200,8 +207,7 @@ def extract_card_effects(soup, fallback_type: str = '') -> Dict[str, Any]:
         if name_el is not None:
             raw = fix_mojibake(name_el.get_text(' ', strip=True))
             # Strip the "Ability:" / "Poké-Power:" / "Poké-Body:" prefix.
-            m = re.match(r'^(?:Ability|Pok[ée]-?Power|Pok[ée]-?Body)\s*:\s*(.+)$',
-                         raw, re.IGNORECASE | re.DOTALL)
+            m = _ABILITY_PREFIX_RE.match(raw)
             ab_name = _norm_ws(m.group(1) if m else raw)
         ab_text = ''
         if effect_el is not None:
@@ -75,6 +75,11 @@ NON_POKEMON_TYPES = {
 
 CARD_URL_TMPL = 'https://limitlesstcg.com/cards/{set}/{number}'
 
+_ATTACK_DAMAGE_RE = re.compile(r'\s+\d+\s*[+×x*]?\s*$')
+_ABILITY_PREFIX_RE = re.compile(r'^(?:Ability|Pok[ée]-?Power|Pok[ée]-?Body)\s*:\s*(.+)$',
+                                re.IGNORECASE | re.DOTALL)
+_WS_RE = re.compile(r'\s+')
+
 
 def _strip_attack_damage(text: str) -> str:
     """Remove trailing damage numbers from attack text.
@@ -85,7 +90,7 @@ def _strip_attack_damage(text: str) -> str:
       'Pelletgun 10+'        → 'Pelletgun'
     """
     # Match a trailing space + digits + optional +/×/x/* qualifier.
-    return re.sub(r'\s+\d+\s*[+×x*]?\s*$', '', text).strip()
+    return _ATTACK_DAMAGE_RE.sub('', text).strip()
 
 
 def extract_disambiguation(soup) -> str:
@@ -108,10 +113,9 @@ def extract_disambiguation(soup) -> str:
         text = fix_mojibake(el.get_text(' ', strip=True))
         # Strip the "Ability:" / "Poké-Power:" / "Poké-Body:" prefixes
         # Limitless uses for legacy formats too.
-        m = re.match(r'^(?:Ability|Pok[ée]-?Power|Pok[ée]-?Body)\s*:\s*(.+)$',
-                     text, re.IGNORECASE | re.DOTALL)
+        m = _ABILITY_PREFIX_RE.match(text)
         if m:
-            parts.append(re.sub(r'\s+', ' ', m.group(1)).strip())
+            parts.append(_WS_RE.sub(' ', m.group(1)).strip())
 
     # Attacks — energy symbols are wrapped in <span class="ptcg-symbol">,
     # remove them so .get_text() yields just "Dragon Headbutt 70".
@@ -124,7 +128,7 @@ def extract_disambiguation(soup) -> str:
             sym.decompose()
         text = fix_mojibake(clone.get_text(' ', strip=True))
         text = _strip_attack_damage(text)
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = _WS_RE.sub(' ', text).strip()
         if text:
             parts.append(text)
 
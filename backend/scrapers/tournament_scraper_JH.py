@@ -10,29 +10,32 @@ Scrapes card usage data from limitlesstcg.com/tournaments
 """
 
 import csv
+import html as html_module
 import re
 import urllib.parse
 import time
-import json
 import os
 import sys
 import logging
 import threading
 import concurrent.futures
-from collections import Counter
+from collections import Counter, deque
+from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import islice
 from typing import List, Dict, Optional, Any, Set, Tuple
 
 try:
-    from bs4 import BeautifulSoup
+    from bs4 import BeautifulSoup, SoupStrainer
 except ImportError:
     print("FEHLER: beautifulsoup4 fehlt! pip install beautifulsoup4")
     sys.exit(1)
 
 from card_scraper_shared import (
     setup_console_encoding, get_app_path, get_data_dir, load_scraped_ids,
-    save_scraped_ids, CardDatabaseLookup, is_trainer_or_energy, is_valid_card,
-    fetch_page_bs4, setup_logging, load_settings, load_set_order,
-    extract_cards_from_decklist_soup
+    save_scraped_ids, mark_scraped_id, CardDatabaseLookup, is_trainer_or_energy,
+    fetch_page_bs4_cached, fetch_page_cached, fetch_page_cached_bytes, prune_http_cache, RequestPacer, safe_fetch_bytes, setup_logging, load_settings, load_set_order,
+    extract_cards_from_decklist_soup, read_json, write_json
 )
 
 setup_console_encoding()
@@ -54,6 +57,9 @@ def load_scraped_tournaments() -> Set[str]:
 def save_scraped_tournaments(tournament_ids: Set[str]) -> None:
     save_scraped_ids(get_scraped_tournaments_file(), tournament_ids, "scraped_tournament_ids")
 
+def mark_scraped_tournament(tournament_id: str) -> None:
+    mark_scraped_id(get_scraped_tournaments_file(), tournament_id)
+
 # ============================================================================
 # SETTINGS
 # ============================================================================
@@ -65,7 +71,8 @@ DEFAULT_SETTINGS: Dict[str, Any] = {
     "output_file": "tournament_cards_data.csv",
     "format_filter": ["Standard"],
     "tournament_types": ["Regional", "Special Event", "LAIC", "EUIC", "NAIC", "Worlds", "International", "Championship"],
-    "append_mode": True
+    "append_mode": True,
+    "prefetch_tournaments": 3
 }
 
 def _load_settings() -> Dict[str, Any]:
@@ -75,9 +82,30 @@ def _load_settings() -> Dict[str, Any]:
 # NETWORK & HTML UTILS
 # ============================================================================
 
-# fetch_page_bs4 imported from card_scraper_shared
+# fetch helpers (fetch_page_cached, safe_fetch_bytes, ...) imported from card_scraper_shared
 # Note: shared version uses timeout=15 (was 20 locally)
 
+# Decklist pages never change once published, so they are cached on disk
+# without a TTL (prune_http_cache drops entries after HTTP_CACHE_MAX_AGE); the
+# listing itself gains new tournaments and is only cached briefly.
+LIST_PAGE_CACHE_TTL = 15 * 60
+# Standings can be fetched for tournaments that are then not marked scraped
+# (prefetched past max_tournaments, or an interrupted run), possibly before
+# their lists are published. Expire them so the next run sees the lists
+# instead of recording the tournament as having none.
+STANDINGS_PAGE_CACHE_TTL = 12 * 60 * 60
+# The tournament page decides the meta/type skip, and skipped tournaments are
+# never marked scraped: re-read it every run so corrections on Limitless
+# (well inside the revalidation window) still reach the skip decision.
+INFO_PAGE_CACHE_TTL = 12 * 60 * 60
+# The listing is paged 100 tournaments at a time; the next pages are fetched
+# while the current one is parsed.
+MAX_LIST_PAGES = 10
+LIST_PAGES_AHEAD = 2
+# The listing is newest-first: once a page ends in this many known IDs in a
+# row, everything older has been scraped already and paging stops.
+KNOWN_ID_RUN_STOP = 30
+
 
 FORMAT_CODE_BY_SET: Dict[str, str] = {
     "ASC": "SVI-ASC",
@@ -145,6 +173,13 @@ def _load_set_order_map() -> Dict[str, int]:
 SET_ORDER_MAP = _load_set_order_map()
 
 
+_COMPACT_FORMAT_RE = re.compile(r"\b(SVI|BRS|BST)\s*[-/]\s*([A-Z]{3})\b")
+_HREF_FORMAT_RE = re.compile(r'[?&]format=([^&]+)', re.IGNORECASE)
+
+
+# Pure string mapping over a handful of distinct inputs (one per tournament,
+# catalog row and revalidated tournament), so results are memoized.
+@lru_cache(maxsize=1024)
 def normalize_tournament_format(raw_format: str) -> str:
     raw = str(raw_format or "").strip()
     if not raw:
@@ -164,7 +199,7 @@ def normalize_tournament_format(raw_format: str) -> str:
             return code
 
     # Normalize common compact patterns like SVI-ASC, BRS-TEF, BST-PAR.
-    compact = re.search(r"\b(SVI|BRS|BST)\s*[-/]\s*([A-Z]{3})\b", upper_raw)
+    compact = _COMPACT_FORMAT_RE.search(upper_raw)
     if compact:
         return f"{compact.group(1)}-{compact.group(2)}"
 
@@ -176,24 +211,19 @@ def normalize_tournament_format(raw_format: str) -> str:
 
 
 def infer_format_from_decks(decks_data: List[Dict[str, Any]]) -> str:
-    newest_set = ""
-    newest_order = -1
-
-    for deck in decks_data:
-        for card in deck.get("cards", []):
-            set_code = str(card.get("set_code", "") or "").upper().strip()
-            if not set_code:
-                continue
-
-            order = SET_ORDER_MAP.get(set_code, 0)
-            if order > newest_order:
-                newest_order = order
-                newest_set = set_code
-
-    if newest_set in FORMAT_CODE_BY_SET:
-        return FORMAT_CODE_BY_SET[newest_set]
+    # A tournament repeats the same few dozen set codes across thousands of
+    # card rows: normalize and rank each distinct raw code only once. The
+    # dict keeps first-seen order, so ties still go to the earliest code.
+    raw_codes = dict.fromkeys(
+        card.get("set_code") for deck in decks_data for card in deck.get("cards", [])
+    )
+    set_codes = dict.fromkeys(str(code or "").upper().strip() for code in raw_codes)
+    set_codes.pop("", None)
+    if not set_codes:
+        return ""
 
-    return ""
+    newest_set = max(set_codes, key=lambda code: SET_ORDER_MAP.get(code, 0))
+    return FORMAT_CODE_BY_SET.get(newest_set, "")
 
 
 def update_formats_catalog(new_formats: List[str]) -> None:
@@ -208,8 +238,7 @@ def update_formats_catalog(new_formats: List[str]) -> None:
 
     try:
         if os.path.exists(catalog_path):
-            with open(catalog_path, "r", encoding="utf-8") as f:
-                existing = json.load(f)
+            existing = read_json(catalog_path)
             for row in existing.get("formats", []):
                 code = normalize_tournament_format(row.get("code", ""))
                 if code:
@@ -231,34 +260,42 @@ def update_formats_catalog(new_formats: List[str]) -> None:
     }
 
     try:
-        with open(catalog_path, "w", encoding="utf-8") as f:
-            json.dump(payload, f, indent=2, ensure_ascii=False)
+        write_json(catalog_path, payload)
         logger.info("Formats catalog updated: %s (%d formats)", catalog_path, len(payload["formats"]))
     except Exception as e:
         logger.warning("Could not write formats catalog: %s", e)
 
+_FORMAT_NAME_CODES: Dict[str, str] = {
+    "Scarlet & Violet - Phantasmal Flames": "SVI-PFL",
+    "Scarlet & Violet - Mega Evolution": "SVI-MEG",
+    "Scarlet & Violet - Surging Sparks": "SVI-SSP",
+    "Scarlet & Violet - Stellar Crown": "SVI-SCR",
+    "Scarlet & Violet - Shrouded Fable": "SVI-SFA",
+    "Scarlet & Violet - Twilight Masquerade": "SVI-TWM",
+    "Scarlet & Violet - Temporal Forces": "SVI-TEF",
+    "Scarlet & Violet - Paldean Fates": "SVI-PAF",
+    "Scarlet & Violet - Paradox Rift": "SVI-PAR",
+    "Scarlet & Violet - Obsidian Flames": "SVI-OBF",
+    "Scarlet & Violet - Paldea Evolved": "SVI-PAL",
+    "Scarlet & Violet - 151": "SVI-MEW",
+    "Scarlet & Violet": "SVI",
+    "Sword & Shield - Silver Tempest": "SWS-SIT",
+    "Sword & Shield - Lost Origin": "SWS-LOR",
+    "Sword & Shield - Astral Radiance": "SWS-ASR",
+    "Sword & Shield - Brilliant Stars": "SWS-BRS",
+}
+# (lowercase name, code) in priority order - specific sets before the bare
+# "Scarlet & Violet" catch-all, since the first substring match wins.
+_FORMAT_NAME_CODES_LOWER: Tuple[Tuple[str, str], ...] = tuple(
+    (name.lower(), code) for name, code in _FORMAT_NAME_CODES.items()
+)
+
+
+@lru_cache(maxsize=1024)
 def get_format_code(format_name: str) -> str:
-    format_mapping = {
-        "Scarlet & Violet - Phantasmal Flames": "SVI-PFL",
-        "Scarlet & Violet - Mega Evolution": "SVI-MEG",
-        "Scarlet & Violet - Surging Sparks": "SVI-SSP",
-        "Scarlet & Violet - Stellar Crown": "SVI-SCR",
-        "Scarlet & Violet - Shrouded Fable": "SVI-SFA",
-        "Scarlet & Violet - Twilight Masquerade": "SVI-TWM",
-        "Scarlet & Violet - Temporal Forces": "SVI-TEF",
-        "Scarlet & Violet - Paldean Fates": "SVI-PAF",
-        "Scarlet & Violet - Paradox Rift": "SVI-PAR",
-        "Scarlet & Violet - Obsidian Flames": "SVI-OBF",
-        "Scarlet & Violet - Paldea Evolved": "SVI-PAL",
-        "Scarlet & Violet - 151": "SVI-MEW",
-        "Scarlet & Violet": "SVI",
-        "Sword & Shield - Silver Tempest": "SWS-SIT",
-        "Sword & Shield - Lost Origin": "SWS-LOR",
-        "Sword & Shield - Astral Radiance": "SWS-ASR",
-        "Sword & Shield - Brilliant Stars": "SWS-BRS",
-    }
-    for full_name, code in format_mapping.items():
-        if full_name.lower() in format_name.lower():
+    lowered = format_name.lower()
+    for full_name, code in _FORMAT_NAME_CODES_LOWER:
+        if full_name in lowered:
             return code
     return normalize_tournament_format(format_name)
 
@@ -267,100 +304,146 @@ def get_format_code(format_name: str) -> str:
 # ============================================================================
 def get_tournament_links(base_url: str, start_tournament_id: Optional[int], scraped_ids: Set[str]) -> List[dict]:
     tournaments = []
-    seen_ids = set()
-    page = 1
+    # One membership check per row: IDs already scraped and IDs already
+    # collected on an earlier page are skipped alike.
+    skip_ids = set(scraped_ids)
 
     logger.info("Suche nach Turnieren auf Limitless...")
 
-    while page <= 10:
-        url = f"{base_url}?show=100&page={page}"
-        soup = fetch_page_bs4(url)
-        if not soup:
-            break
-
-        rows = [tr for tr in soup.select("table tr") if tr.find("td")]
-        if not rows:
-            break
-
-        found_on_page = 0
-        for row in rows:
-            link = row.select_one('a[href^="/tournaments/"]')
-            if not link:
-                continue
-
-            href = link["href"]
-            t_id_str = href.split("/")[-1]
-            if not t_id_str.isdigit():
-                continue
+    urls = [f"{base_url}?show=100&page={page}" for page in range(1, MAX_LIST_PAGES + 1)]
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=LIST_PAGES_AHEAD)
+    try:
+        soups = _iter_prefetched(
+            executor,
+            lambda url: fetch_page_bs4_cached(url, ttl=LIST_PAGE_CACHE_TTL),
+            urls,
+            LIST_PAGES_AHEAD,
+        )
+        for soup in soups:
+            if not soup:
+                break
 
-            t_id = int(t_id_str)
+            rows = [tr for tr in soup.select("table tr") if tr.find("td")]
+            if not rows:
+                break
 
-            if start_tournament_id and t_id < start_tournament_id:
-                logger.info("Stop-ID erreicht (%s < %s). Beende Suche.", t_id, start_tournament_id)
-                return tournaments
+            found_on_page = 0
+            known_run = 0
+            for row in rows:
+                link = row.select_one('a[href^="/tournaments/"]')
+                if not link:
+                    continue
+
+                href = link["href"]
+                t_id_str = href.split("/")[-1]
+                if not t_id_str.isdigit():
+                    continue
+
+                # IDs stay strings (tracking files and skip set store them that way);
+                # the int is only needed for the optional stop-ID check.
+                if start_tournament_id and int(t_id_str) < start_tournament_id:
+                    logger.info("Stop-ID erreicht (%s < %s). Beende Suche.", t_id_str, start_tournament_id)
+                    return tournaments
+
+                if t_id_str in skip_ids:
+                    known_run += 1
+                    continue
+
+                skip_ids.add(t_id_str)
+                tournaments.append({
+                    "id": t_id_str,
+                    "url": f"https://limitlesstcg.com{href}",
+                    "cards_url": f"https://limitlesstcg.com{href}/cards"
+                })
+                found_on_page += 1
+                known_run = 0
+
+            if found_on_page == 0 or known_run >= KNOWN_ID_RUN_STOP:
+                break
+    finally:
+        # Pages fetched ahead of a stop are simply dropped.
+        executor.shutdown(wait=False, cancel_futures=True)
 
-            if t_id_str not in seen_ids:
-                seen_ids.add(t_id_str)
-                if t_id_str not in scraped_ids:
-                    tournaments.append({
-                        "id": t_id_str,
-                        "url": f"https://limitlesstcg.com{href}",
-                        "cards_url": f"https://limitlesstcg.com{href}/cards"
-                    })
-                    found_on_page += 1
+    return tournaments
 
-        if found_on_page == 0:
-            break
-        page += 1
+_TITLE_TAG_RE = re.compile(r'<title[^>]*>(.*?)</title>', re.IGNORECASE | re.DOTALL)
+_TITLE_SUFFIX_RE = re.compile(r'\s*\|\s*Limitless.*$', re.IGNORECASE)
+_INFO_DATE_RE = re.compile(r'(\d{1,2}(?:st|nd|rd|th)?\s+\w+\s+\d{4})')
+_INFO_PLAYERS_RE = re.compile(r'(\d+)\s*Players', re.IGNORECASE)
+_FORMAT_LINK_RE = re.compile(r'<a[^>]*href=["\'][^"\']*[?&]format=([^"\'&]+)["\'][^>]*>', re.IGNORECASE)
+_JP_KR_RE = re.compile(r'\bKR\b|\bJP\b')
+_FLAG_OR_JP_KR_RE = re.compile(r'(<img[^>]*flags/[A-Z]{2}\.png)|\bKR\b|\bJP\b')
+
+# Known format names for the page-text fallback, in FORMAT_NAME_TO_CODE
+# priority order. One alternation (longest names first, so a combined name
+# like "black bolt / white flare" wins over its prefix) finds all of them in a
+# single case-insensitive pass over the page text.
+_PAGE_TEXT_FORMATS: Tuple[Tuple[str, str], ...] = tuple(
+    (name, code) for name, code in FORMAT_NAME_TO_CODE.items()
+    if code not in {"Meta Live", "Meta Play!"}
+)
+_KNOWN_FORMAT_NAME_RE = re.compile(
+    "|".join(re.escape(name) for name, _ in sorted(_PAGE_TEXT_FORMATS, key=lambda item: len(item[0]), reverse=True)),
+    re.IGNORECASE,
+)
 
-    return tournaments
 
 def get_tournament_info(url: str) -> dict:
     info = {"name": "Unknown", "date": "", "players": "", "format": "", "meta": "Standard"}
-    soup = fetch_page_bs4(url)
-    if not soup:
+    # Every field is read with regexes on the fetched HTML; the page is only
+    # parsed into a tree when the format has to be recovered from its text.
+    html_text = fetch_page_cached(url, ttl=INFO_PAGE_CACHE_TTL)
+    if not html_text:
         return info
 
-    html_text = str(soup)
-
     # 1. Name aus dem Title-Tag extrahieren (viel sicherer)
-    title_tag = soup.find("title")
-    if title_tag:
-        title = title_tag.get_text(strip=True)
-        info["name"] = re.sub(r'\s*\|\s*Limitless.*$', '', title, flags=re.IGNORECASE).strip()
+    title_match = _TITLE_TAG_RE.search(html_text)
+    if title_match:
+        title = title_match.group(1).strip()
+        if '&' in title:
+            title = html_module.unescape(title)
+        info["name"] = _TITLE_SUFFIX_RE.sub('', title).strip()
 
     # 2. Datum und Spieler extrahieren
-    date_match = re.search(r'(\d{1,2}(?:st|nd|rd|th)?\s+\w+\s+\d{4})', html_text)
+    date_match = _INFO_DATE_RE.search(html_text)
     if date_match:
         info["date"] = date_match.group(1)
 
-    players_match = re.search(r'(\d+)\s*Players', html_text, re.IGNORECASE)
+    players_match = _INFO_PLAYERS_RE.search(html_text)
     if players_match:
         info["players"] = players_match.group(1)
 
     # 3. Format aus URL-Parametern extrahieren (falls vorhanden)
-    format_code_match = re.search(r'<a[^>]*href=["\'][^"\']*[?&]format=([^"\'&]+)["\'][^>]*>', html_text, re.IGNORECASE)
+    format_code_match = _FORMAT_LINK_RE.search(html_text)
     if format_code_match:
         raw_format = urllib.parse.unquote(format_code_match.group(1).strip())
         info["format"] = normalize_tournament_format(raw_format)
 
     # 3b. Fallback: bekannte Format-Namen direkt im Seitentext erkennen
     if not info["format"]:
-        page_text = soup.get_text(" ", strip=True).lower()
-        for known_name, format_code in FORMAT_NAME_TO_CODE.items():
-            if known_name in page_text and format_code not in {"Meta Live", "Meta Play!"}:
-                info["format"] = format_code
-                break
+        page_text = BeautifulSoup(html_text, 'lxml').get_text(" ", strip=True)
+        found = {m.group(0).lower() for m in _KNOWN_FORMAT_NAME_RE.finditer(page_text)}
+        if found:
+            info["format"] = next(code for name, code in _PAGE_TEXT_FORMATS if name in found)
 
     # 4. Meta korrekt zuweisen
     is_jp = False
     if "Standard (JP)" in html_text or "Champions League" in info["name"] or "Regional League" in info["name"]:
         is_jp = True
 
-    jp_kr_count = len(re.findall(r'\bKR\b|\bJP\b', html_text))
-    total_flags = len(re.findall(r'<img[^>]*flags/[A-Z]{2}\.png', html_text))
-    if total_flags > 20 and jp_kr_count > total_flags * 0.7:
-        is_jp = True
+    if not is_jp:
+        # One pass counts both flag images and JP/KR tokens; tokens inside a
+        # matched flag tag (e.g. ".../flags/JP.png") are counted from the match.
+        total_flags = jp_kr_count = 0
+        for m in _FLAG_OR_JP_KR_RE.finditer(html_text):
+            flag_tag = m.group(1)
+            if flag_tag:
+                total_flags += 1
+                jp_kr_count += len(_JP_KR_RE.findall(flag_tag))
+            else:
+                jp_kr_count += 1
+        if total_flags > 20 and jp_kr_count > total_flags * 0.7:
+            is_jp = True
 
     if is_jp:
         info["meta"] = "Standard (JP)"
@@ -371,17 +454,22 @@ def get_tournament_info(url: str) -> dict:
 
     return info
 
+# Only these anchors are built into a tree; the rest of the page (a standings
+# table of up to 2000 rows) is skipped by the parser
+_DECK_LIST_ANCHORS = SoupStrainer('a', href=re.compile(r'^/decks/list/'))
+_HREF_ANCHORS = SoupStrainer('a', href=True)
+
+
 def get_deck_list_links(url: str) -> List[dict]:
     fetch_url = f"{url}?show=2000"
-    soup = fetch_page_bs4(fetch_url)
-    if not soup:
+    html = fetch_page_cached_bytes(fetch_url, ttl=STANDINGS_PAGE_CACHE_TTL)
+    # Standings without published lists have no deck links at all; a
+    # substring check skips parsing the (up to 2000-row) page for them.
+    if not html or b'/decks/list/' not in html:
         return []
 
-    deck_ids = []
-    for a in soup.select('a[href^="/decks/list/"]'):
-        deck_ids.append(a["href"].split("/")[-1])
-
-    counts = Counter(deck_ids)
+    soup = BeautifulSoup(html, 'lxml', from_encoding='utf-8', parse_only=_DECK_LIST_ANCHORS)
+    counts = Counter(a["href"].rsplit("/", 1)[-1] for a in soup.find_all('a'))
     return [{"url": f"https://limitlesstcg.com/decks/list/{d_id}", "player_count": count} for d_id, count in counts.items()]
 
 # ============================================================================
@@ -406,10 +494,18 @@ def _clean_deck_name(name: str) -> str:
     return cleaned or name  # never return empty if regex over-matches
 
 
+# A decklist page is read for its title and card columns only; the parser
+# skips building the navigation, footer and scripts around them. While
+# parsing, class is still the raw attribute string ("decklist-column foo"),
+# hence a whole-word regex rather than a list of class names.
+_DECKLIST_PARTS = SoupStrainer(class_=re.compile(r'(?:^|\s)decklist-(?:title|column)(?:\s|$)'))
+
+
 def extract_single_deck(deck_url: str, card_db: CardDatabaseLookup) -> Tuple[list, str]:
-    soup = fetch_page_bs4(deck_url)
-    if not soup:
+    html = fetch_page_cached_bytes(deck_url)
+    if not html:
         return [], "Unknown Deck"
+    soup = BeautifulSoup(html, 'lxml', from_encoding='utf-8', parse_only=_DECKLIST_PARTS)
 
     title_elem = soup.select_one(".decklist-title")
     raw_deck_name = title_elem.get_text(strip=True) if title_elem else "Unknown Deck"
@@ -418,63 +514,92 @@ def extract_single_deck(deck_url: str, card_db: CardDatabaseLookup) -> Tuple[lis
     # Use shared extraction, then enrich with tournament-specific fields
     raw_cards = extract_cards_from_decklist_soup(soup, card_db)
 
-    cards = []
-    seen = set()
+    # Keyed by name|set|number; the first occurrence wins, insertion order kept.
+    # The key rides along as "_key" so aggregate_tournament_cards reuses it.
+    cards_by_key: Dict[str, dict] = {}
+    # Check against the caller's card_db (not the module-level singleton) via
+    # plain dict/set lookups on the normalized name
+    normalize = card_db.normalize_name
+    known_names = card_db.cards
+    ace_spec_names = card_db.ace_spec_names
     for c in raw_cards:
         name = c['name']
-        if not is_valid_card(name):
+        norm = normalize(name)
+        if norm not in known_names:
             continue
         sc, sn = c['set_code'], c['set_number']
         key = f"{name}|{sc}|{sn}".lower()
-        if key not in seen:
-            seen.add(key)
-            cards.append({
-                "count": c['count'],
-                "name": name,
-                "set_code": sc,
-                "card_number": sn,
-                "full_name": f"{name} {sc} {sn}".strip(),
-                "is_ace_spec": "Yes" if card_db.is_ace_spec_by_name(name) else "No"
-            })
+        if key in cards_by_key:
+            continue
+        cards_by_key[key] = {
+            "count": c['count'],
+            "name": name,
+            "set_code": sc,
+            "card_number": sn,
+            "is_ace_spec": "Yes" if norm in ace_spec_names else "No",
+            "_key": key,
+        }
 
-    return cards, deck_name
+    return list(cards_by_key.values()), deck_name
 
 def aggregate_tournament_cards(all_decks: list, t_info: dict, card_db: CardDatabaseLookup) -> list:
     """
     Aggregiert Karten mit neuen Competitive-Metriken:
     - deck_inclusion_count: Anzahl Decks mit dieser Karte (mind. 1x)
     - average_count: Durchschnittliche Anzahl pro Deck, wenn gespielt
+
+    Cards from extract_single_deck carry their name|set|number key as "_key"
+    and are unique per deck, so they skip the key build and per-deck dedup;
+    cards from any other source (no "_key") are keyed and deduplicated here.
     """
     groups = {}
     for d in all_decks:
         groups.setdefault(d["deck_name"], []).append(d)
 
-    aggregated = []
-
+    group_stats = []
     for arch_name, decks in groups.items():
         total_p = sum(d["player_count"] for d in decks)
         stats = {}
 
         for d in decks:
             p_cnt = d["player_count"]
-            deck_seen = set()
+            deck_seen = set()  # only needed for cards without a precomputed _key
 
             for c in d["cards"]:
-                k = f"{c['name']}|{c['set_code']}|{c['card_number']}".lower()
-                if k not in stats:
-                    stats[k] = {"total_count": 0, "max_count": 0, "player_count": 0, "sample": c}
-
-                stats[k]["total_count"] += c["count"] * p_cnt
-                stats[k]["max_count"] = max(stats[k]["max_count"], c["count"])
-
-                if k not in deck_seen:
+                k = c.get("_key")
+                if k is None:
+                    k = f"{c['name']}|{c['set_code']}|{c['card_number']}".lower()
+                    first_in_deck = k not in deck_seen
                     deck_seen.add(k)
-                    stats[k]["player_count"] += p_cnt
+                else:
+                    first_in_deck = True  # extract_single_deck lists each key once
+                st = stats.get(k)
+                if st is None:
+                    st = stats[k] = {"total_count": 0, "max_count": 0, "player_count": 0, "sample": c}
+
+                count = c["count"]
+                st["total_count"] += count * p_cnt
+                if count > st["max_count"]:
+                    st["max_count"] = count
+                if first_in_deck:
+                    st["player_count"] += p_cnt
+
+        group_stats.append((arch_name, total_p, stats))
+
+    # get_card scans the whole DB; resolve every print of the tournament in
+    # one pass instead of one scan per (set, number)
+    db_cards = card_db.manager.get_cards_bulk({
+        (stat["sample"]["set_code"], stat["sample"]["card_number"])
+        for _, _, stats in group_stats for stat in stats.values()
+        if stat["sample"]["set_code"]
+    })
 
+    aggregated = []
+    for arch_name, total_p, stats in group_stats:
         for stat in stats.values():
             samp  = stat["sample"]
-            db_c  = card_db.manager.get_card(samp["set_code"], samp["card_number"]) if samp["set_code"] else None
-            
+            db_c  = db_cards.get((samp["set_code"], samp["card_number"])) if samp["set_code"] else None
+
             # NEUE METRIKEN (Competitive-Analyse)
             deck_inclusion_count = stat["player_count"]  # Wie viele Decks haben die Karte mind. 1x?
             average_count = round(stat["total_count"] / deck_inclusion_count, 2) if deck_inclusion_count > 0 else 0
@@ -507,12 +632,9 @@ def aggregate_tournament_cards(all_decks: list, t_info: dict, card_db: CardDatab
 # ============================================================================
 # CSV OUTPUT
 # ============================================================================
-def save_csv_files(data: list, output_file: str, append_mode: bool):
-    overview_f = os.path.join(get_data_dir(), output_file.replace(".csv", "_overview.csv"))
-    cards_f    = os.path.join(get_data_dir(), output_file.replace(".csv", "_cards.csv"))
-
-    o_rows = [
-        {
+def _overview_rows(data: list):
+    for t in data:
+        yield {
             "tournament_id": t["id"],
             "tournament_name": t["name"],
             "tournament_date": t.get("date", ""),
@@ -522,10 +644,9 @@ def save_csv_files(data: list, output_file: str, append_mode: bool):
             "total_cards": t.get("total_cards", 0),
             "status": t["status"]
         }
-        for t in data
-    ]
 
-    c_rows = []
+
+def _card_rows(data: list):
     for t in data:
         for c in t.get("cards", []):
             cr = c.copy()
@@ -533,21 +654,32 @@ def save_csv_files(data: list, output_file: str, append_mode: bool):
             cr["percentage_in_archetype"] = str(cr["percentage_in_archetype"]).replace(".", ",")
             if "average_count" in cr:
                 cr["average_count"] = str(cr["average_count"]).replace(".", ",")
-            c_rows.append(cr)
+            yield cr
 
-    for f_path, rows in [(overview_f, o_rows), (cards_f, c_rows)]:
-        if not rows:
-            continue
-        fields = list(rows[0].keys())
-        mode = "a" if append_mode and os.path.exists(f_path) else "w"
-        with open(f_path, mode, newline="", encoding="utf-8-sig") as f:
-            writer = csv.DictWriter(f, fieldnames=fields, delimiter=";")
-            if mode == "w":
-                writer.writeheader()
-            writer.writerows(rows)
 
-            formats_for_catalog = [str(row.get("format", "") or "") for row in o_rows]
-            update_formats_catalog(formats_for_catalog)
+def _write_csv_rows(f_path: str, rows, append_mode: bool) -> None:
+    """Stream rows into f_path; the header comes from the first row's keys."""
+    first = next(rows, None)
+    if first is None:
+        return
+    mode = "a" if append_mode and os.path.exists(f_path) else "w"
+    with open(f_path, mode, newline="", encoding="utf-8-sig") as f:
+        writer = csv.DictWriter(f, fieldnames=list(first), delimiter=";")
+        if mode == "w":
+            writer.writeheader()
+        writer.writerow(first)
+        writer.writerows(rows)
+
+
+def save_csv_files(data: list, output_file: str, append_mode: bool):
+    overview_f = os.path.join(get_data_dir(), output_file.replace(".csv", "_overview.csv"))
+    cards_f    = os.path.join(get_data_dir(), output_file.replace(".csv", "_cards.csv"))
+
+    _write_csv_rows(overview_f, _overview_rows(data), append_mode)
+    _write_csv_rows(cards_f, _card_rows(data), append_mode)
+
+    if data:
+        update_formats_catalog([str(t.get("format", "") or "") for t in data])
 
     return overview_f, cards_f
 
@@ -578,6 +710,7 @@ _MONTHS_FULL = {m.lower(): i + 1 for i, m in enumerate([
     'July', 'August', 'September', 'October', 'November', 'December'])}
 
 
+@lru_cache(maxsize=4096)  # called once per monolith row, few distinct dates
 def _parse_english_ordinal_date(s: str):
     """Parse '25th April 2026' → datetime, or None."""
     if not s:
@@ -585,12 +718,11 @@ def _parse_english_ordinal_date(s: str):
     m = _TOURNAMENT_DATE_RE.match(s.strip())
     if not m:
         return None
-    mn = m.group(2).lower()
-    if mn not in _MONTHS_FULL:
+    month = _MONTHS_FULL.get(m.group(2).lower())
+    if month is None:
         return None
     try:
-        from datetime import datetime as _dt
-        return _dt(int(m.group(3)), _MONTHS_FULL[mn], int(m.group(1)))
+        return datetime(int(m.group(3)), month, int(m.group(1)))
     except ValueError:
         return None
 
@@ -607,12 +739,13 @@ def _fetch_current_format(tournament_id: str) -> Optional[str]:
     miss every match.
     """
     url = f"https://limitlesstcg.com/tournaments/{tournament_id}"
-    soup = fetch_page_bs4(url)
-    if not soup:
+    html = safe_fetch_bytes(url)
+    if not html:
         return None
-    for a in soup.select('a[href]'):
+    soup = BeautifulSoup(html, 'lxml', parse_only=_HREF_ANCHORS)
+    for a in soup.find_all('a'):
         href = a.get('href') or ''
-        m = re.search(r'[?&]format=([^&]+)', href, re.IGNORECASE)
+        m = _HREF_FORMAT_RE.search(href)
         if m:
             return urllib.parse.unquote(m.group(1).strip())
     return None
@@ -632,8 +765,7 @@ def revalidate_recent_tournament_meta(monolith_path: str,
         logger.info("[revalidate-meta] No monolith yet at %s — skipping.", monolith_path)
         return 0, 0
 
-    from datetime import datetime as _dt, timedelta as _td
-    cutoff = _dt.now() - _td(days=max_age_days)
+    cutoff = datetime.now() - timedelta(days=max_age_days)
 
     # Pass 1: scan the CSV, build {tournament_id → (current_meta, latest_date)}
     # for tournaments inside the recency window.
@@ -664,21 +796,23 @@ def revalidate_recent_tournament_meta(monolith_path: str,
 
     # Pass 2: hit Limitless for each candidate, build the rewrite map.
     # (tid → new_meta) only contains entries where the tag actually changed.
+    # Requests start at least `delay` apart; time spent fetching counts
+    # towards the gap instead of being followed by a full sleep.
     rewrites: Dict[str, str] = {}
+    pacer = RequestPacer(delay)
     for tid, info in sorted(candidates.items()):
         current_meta = str(info.get("meta") or "").strip()
+        pacer.wait()
         live_format = _fetch_current_format(tid)
         if live_format is None:
             logger.warning("[revalidate-meta] %s: no format link on tournament page — keeping %r",
                            tid, current_meta)
-            time.sleep(delay)
             continue
         normalized = normalize_tournament_format(live_format)
         if normalized and normalized != current_meta:
             logger.info("[revalidate-meta] %s (%s): %s → %s",
                         tid, info.get("name", "")[:50], current_meta, normalized)
             rewrites[tid] = normalized
-        time.sleep(delay)
 
     if not rewrites:
         logger.info("[revalidate-meta] All %d tournaments already correctly tagged.", len(candidates))
@@ -785,12 +919,51 @@ def _reassemble_monolith_from_chunks(monolith_path: str, data_dir: str) -> int:
     return rows_written
 
 
+def _tournament_types_re(tournament_types: List[str]) -> "re.Pattern[str]":
+    """One case-insensitive alternation for the substring filter on tournament names."""
+    if not tournament_types:
+        return re.compile(r'(?!)')  # nothing configured -> nothing matches
+    return re.compile('|'.join(re.escape(tt) for tt in tournament_types), re.IGNORECASE)
+
+
+def _resolve_tournament(t: dict, types_re: "re.Pattern[str]") -> dict:
+    """Fetch tournament info and, if the tournament passes the filters, its deck links.
+
+    Runs ahead of the main loop on a worker thread; sets t["skip"] to the
+    reason a tournament is skipped (None if it should be scraped).
+    """
+    t.update(get_tournament_info(t["url"]))
+    t["format"] = normalize_tournament_format(t.get("format", ""))
+
+    if t["meta"] in ["Standard (JP)", "Expanded"]:
+        t["skip"] = "meta"
+    elif not types_re.search(t["name"]):
+        t["skip"] = "type"
+    else:
+        t["skip"] = None
+        t["deck_links"] = get_deck_list_links(t["url"])
+    return t
+
+
+def _iter_prefetched(executor: concurrent.futures.Executor, fn, items: List[Any], ahead: int):
+    """Yield fn(item) for items in order, keeping up to `ahead` calls in flight."""
+    it = iter(items)
+    pending = deque(executor.submit(fn, item) for item in islice(it, ahead))
+    while pending:
+        future = pending.popleft()
+        nxt = next(it, None)
+        if nxt is not None:
+            pending.append(executor.submit(fn, nxt))
+        yield future.result()
+
+
 def main():
     logger.info("=" * 60)
     logger.info("TOURNAMENT SCRAPER JH - FAST EDITION")
     logger.info("=" * 60)
 
     settings = _load_settings()
+    prune_http_cache()
 
     try:
         card_db = CardDatabaseLookup()
@@ -831,55 +1004,72 @@ def main():
         logger.info("Keine neuen Turniere gefunden.")
         return
 
+    # Tournament info + standings for the next few tournaments are fetched in
+    # the background while the current tournament's decklists are loading.
+    ahead = max(1, int(settings.get("prefetch_tournaments", 3)))
+    prefetch_executor = concurrent.futures.ThreadPoolExecutor(max_workers=ahead)
+    # One decklist pool for the whole run instead of a fresh one per tournament
+    deck_executor = concurrent.futures.ThreadPoolExecutor(max_workers=settings["max_workers"])
+    types_re = _tournament_types_re(settings["tournament_types"])
+    resolved = _iter_prefetched(
+        prefetch_executor,
+        lambda t: _resolve_tournament(t, types_re),
+        tournaments,
+        ahead,
+    )
+    try:
+        _scrape_resolved(resolved, settings, card_db, scraped_ids, deck_executor)
+    finally:
+        prefetch_executor.shutdown(wait=False, cancel_futures=True)
+        deck_executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _scrape_resolved(resolved, settings: Dict[str, Any], card_db: CardDatabaseLookup, scraped_ids: Set[str],
+                     executor: concurrent.futures.Executor) -> None:
     max_t     = settings["max_tournaments"]
     processed = 0
     newly_scraped: Set[str] = set()
 
-    for t in tournaments:
+    for t in resolved:
         if processed >= max_t:
             break
 
-        info = get_tournament_info(t["url"])
-        t.update(info)
-        t["format"] = normalize_tournament_format(t.get("format", ""))
-
-        name_lower = t["name"].lower()
-        if t["meta"] in ["Standard (JP)", "Expanded"]:
-            logger.info(f"Ueberspringe: {t['name']} ({t['meta']})")
+        if t["skip"] == "meta":
+            logger.info("Ueberspringe: %s (%s)", t['name'], t['meta'])
             continue
 
-        if not any(tt.lower() in name_lower for tt in settings["tournament_types"]):
+        if t["skip"]:
             continue
 
-        logger.info(f"Lade Turnier: {t['name']} ({t['format']})")
-        deck_links = get_deck_list_links(t["url"])
+        logger.info("Lade Turnier: %s (%s)", t['name'], t['format'])
+        deck_links = t.pop("deck_links")
 
         if not deck_links:
             t["cards"]  = []
             t["status"] = "no decks found"
             newly_scraped.add(t["id"])
+            mark_scraped_tournament(t["id"])
             continue
 
         logger.info("Lade %s Decklisten parallel...", len(deck_links))
         decks_data = []
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=settings["max_workers"]) as executor:
-            futures = {
-                executor.submit(extract_single_deck, d["url"], card_db): d
-                for d in deck_links
-            }
-            for future in concurrent.futures.as_completed(futures):
-                d_info = futures[future]
-                try:
-                    c_list, d_name = future.result()
-                    if c_list:
-                        decks_data.append({
-                            "cards": c_list,
-                            "player_count": d_info["player_count"],
-                            "deck_name": d_name
-                        })
-                except Exception as e:
-                    logger.warning(f"Fehler bei {d_info['url']}: {e}")
+        futures = {
+            executor.submit(extract_single_deck, d["url"], card_db): d
+            for d in deck_links
+        }
+        for future in concurrent.futures.as_completed(futures):
+            d_info = futures[future]
+            try:
+                c_list, d_name = future.result()
+                if c_list:
+                    decks_data.append({
+                        "cards": c_list,
+                        "player_count": d_info["player_count"],
+                        "deck_name": d_name
+                    })
+            except Exception as e:
+                logger.warning("Fehler bei %s: %s", d_info['url'], e)
 
         if decks_data:
             if not t.get("format"):
@@ -897,10 +1087,14 @@ def main():
         newly_scraped.add(t["id"])
         processed += 1
 
-        # Inkrementelles Speichern nach jedem Turnier
-        save_scraped_tournaments(scraped_ids | newly_scraped)
+        # Inkrementelles Speichern nach jedem Turnier (ID nur ans Journal anhaengen)
+        mark_scraped_tournament(t["id"])
         save_csv_files([t], settings["output_file"], append_mode=(settings["append_mode"] if processed == 1 else True))
-        logger.info(f"Gespeichert: {t['name']} ({t['total_cards']} Karten-Eintraege)")
+        logger.info("Gespeichert: %s (%s Karten-Eintraege)", t['name'], t['total_cards'])
+
+    # Fold the journal back into the tracking JSON once per run
+    if newly_scraped:
+        save_scraped_tournaments(scraped_ids | newly_scraped)
 
     logger.info("=" * 60)
     logger.info("Scraping beendet. %s Turniere verarbeitet.", processed)
@@ -911,4 +1105,4 @@ if __name__ == "__main__":
     try:
         main()
     except Exception as e:
-        logger.critical(f"Abbruch: {e}", exc_info=True)
+        logger.critical("Abbruch: %s", e, exc_info=True)
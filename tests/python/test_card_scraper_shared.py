@@ -0,0 +1,206 @@
+"""Unit tests for backend.core.card_scraper_shared.
+
+File-backed helpers run against a temporary directory, and the card sorting /
+lookup helpers against small in-memory data. Nothing here touches the network.
+"""
+from __future__ import annotations
+
+import json
+import os
+import random
+import time
+
+import pytest
+
+from backend.core import card_scraper_shared as shared
+
+
+def _set_mtime(path, seconds_ago):
+    t = time.time() - seconds_ago
+    os.utime(path, (t, t))
+
+
+class TestScrapedIds:
+    def test_mark_scraped_id_round_trip(self, tmp_path):
+        tracking = str(tmp_path / "scraped.json")
+        shared.save_scraped_ids(tracking, {"1", "2"})
+        shared.mark_scraped_id(tracking, "3")
+        shared.mark_scraped_id(tracking, "4")
+
+        assert shared.load_scraped_ids(tracking) == {"1", "2", "3", "4"}
+
+        # Saving folds the journal into the JSON and removes it
+        shared.save_scraped_ids(tracking, shared.load_scraped_ids(tracking))
+        assert not os.path.exists(shared._scraped_ids_journal(tracking))
+        with open(tracking, encoding="utf-8") as f:
+            assert json.load(f)["scraped_ids"] == ["1", "2", "3", "4"]
+        assert shared.load_scraped_ids(tracking) == {"1", "2", "3", "4"}
+
+    def test_save_skips_rewrite_when_unchanged(self, tmp_path, monkeypatch):
+        tracking = str(tmp_path / "scraped.json")
+        writes = []
+        real_write_json = shared.write_json
+        monkeypatch.setattr(shared, "write_json",
+                            lambda path, data: (writes.append(path), real_write_json(path, data)))
+
+        shared.save_scraped_ids(tracking, {"1", "2"})
+        shared.save_scraped_ids(tracking, {"2", "1"})
+        assert len(writes) == 1
+
+        shared.save_scraped_ids(tracking, {"1", "2", "3"})
+        assert len(writes) == 2
+        assert shared.load_scraped_ids(tracking) == {"1", "2", "3"}
+
+    def test_save_rewrites_after_external_change(self, tmp_path):
+        tracking = str(tmp_path / "scraped.json")
+        shared.save_scraped_ids(tracking, {"1"})
+        with open(tracking, "w", encoding="utf-8") as f:
+            json.dump({"scraped_ids": ["9"]}, f)
+
+        shared.save_scraped_ids(tracking, {"1"})
+        assert shared.load_scraped_ids(tracking) == {"1"}
+
+
+class TestSettingsFileCache:
+    def test_invalidates_on_mtime_change(self, tmp_path):
+        path = str(tmp_path / "settings.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"max_workers": 1}, f)
+        _set_mtime(path, 3600)
+        assert shared._read_settings_file(path) == {"max_workers": 1}
+
+        # Same size, new content: only the mtime tells the cache apart
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"max_workers": 2}, f)
+        assert shared._read_settings_file(path) == {"max_workers": 2}
+
+    def test_returns_independent_copies(self, tmp_path):
+        path = str(tmp_path / "settings.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"nested": {"a": 1}}, f)
+        first = shared._read_settings_file(path)
+        first["nested"]["a"] = 99
+        assert shared._read_settings_file(path) == {"nested": {"a": 1}}
+
+
+class TestFetchPageCached:
+    @pytest.fixture
+    def fetches(self, tmp_path, monkeypatch):
+        calls = []
+        pages = {}
+
+        def fake_fetch(url, timeout=15, retries=2, *args, **kwargs):
+            calls.append(url)
+            return pages.get(url, "")
+
+        monkeypatch.setattr(shared, "get_data_dir", lambda: str(tmp_path))
+        monkeypatch.setattr(shared, "safe_fetch_html", fake_fetch)
+        return calls, pages
+
+    def test_hit_without_ttl_skips_fetch(self, fetches):
+        calls, pages = fetches
+        pages["https://x/1"] = "<html>one</html>"
+        assert shared.fetch_page_cached("https://x/1") == "<html>one</html>"
+        pages["https://x/1"] = "<html>changed</html>"
+        assert shared.fetch_page_cached("https://x/1") == "<html>one</html>"
+        assert shared.fetch_page_cached_bytes("https://x/1") == b"<html>one</html>"
+        assert calls == ["https://x/1"]
+
+    def test_expired_entry_is_refetched(self, fetches):
+        calls, pages = fetches
+        pages["https://x/1"] = "old"
+        shared.fetch_page_cached("https://x/1", ttl=60)
+        assert shared.fetch_page_cached("https://x/1", ttl=60) == "old"
+        assert len(calls) == 1
+
+        _set_mtime(shared._http_cache_path("https://x/1"), 120)
+        pages["https://x/1"] = "new"
+        assert shared.fetch_page_cached("https://x/1", ttl=60) == "new"
+        assert len(calls) == 2
+
+    def test_failed_fetch_is_not_cached(self, fetches):
+        calls, pages = fetches
+        assert shared.fetch_page_cached("https://x/2") == ""
+        assert not os.path.exists(shared._http_cache_path("https://x/2"))
+
+        pages["https://x/2"] = "ok"
+        assert shared.fetch_page_cached("https://x/2") == "ok"
+        assert calls == ["https://x/2", "https://x/2"]
+
+    def test_prune_removes_only_old_entries(self, fetches):
+        _, pages = fetches
+        pages["https://x/old"] = pages["https://x/new"] = "page"
+        shared.fetch_page_cached("https://x/old")
+        shared.fetch_page_cached("https://x/new")
+        _set_mtime(shared._http_cache_path("https://x/old"), 3600)
+
+        assert shared.prune_http_cache(max_age=60) == 1
+        assert not os.path.exists(shared._http_cache_path("https://x/old"))
+        assert os.path.exists(shared._http_cache_path("https://x/new"))
+
+
+class TestSortBySetAndNumber:
+    SET_ORDER = {"SVI": 10, "PAL": 20, "MEW": 30}
+
+    def test_matches_card_sort_key_order(self):
+        rng = random.Random(7)
+        for _ in range(200):
+            cards = [
+                {"set": rng.choice(["SVI", "PAL", "MEW", "XXX", ""]),
+                 "number": rng.choice(["1", "01", "2", "10", "TG03", "185a", ""]),
+                 "i": i}
+                for i in range(rng.randint(0, 15))
+            ]
+            expected = sorted(cards, key=lambda c: shared.card_sort_key(c, self.SET_ORDER))
+            shared.sort_by_set_and_number(cards, self.SET_ORDER,
+                                          lambda c: c["set"], lambda c: c["number"])
+            assert cards == expected
+
+    def test_reports_whether_items_moved(self):
+        rows = [["SVI", "2"], ["MEW", "1"], ["SVI", "1"]]
+        assert shared.sort_by_set_and_number(rows, self.SET_ORDER,
+                                             lambda r: r[0], lambda r: r[1]) is True
+        assert rows == [["MEW", "1"], ["SVI", "1"], ["SVI", "2"]]
+        assert shared.sort_by_set_and_number(rows, self.SET_ORDER,
+                                             lambda r: r[0], lambda r: r[1]) is False
+
+
+class TestGetCardsBulk:
+    @staticmethod
+    def _db(variants):
+        db = shared.CardDatabaseLookup.__new__(shared.CardDatabaseLookup)
+        db.manager = db
+        db.cards = {}
+        for name, set_code, number, rarity in variants:
+            db.cards.setdefault(name, []).append({
+                "name": name, "set_code": set_code, "set_number": number, "number": number,
+                "rarity": rarity, "type": "Item", "supertype": "Trainer", "image_url": f"{set_code}/{number}",
+            })
+        return db
+
+    def test_matches_get_card(self):
+        db = self._db([
+            ("iono", "PAL", "185", "Uncommon"),
+            ("iono", "pal", "185", "Special Illustration Rare"),
+            ("rare candy", "SVI", "191", "Uncommon"),
+            ("rare candy", "PAL", "185", "Hyper Rare"),
+        ])
+        pairs = [("PAL", "185"), ("pal", "185"), ("SVI", "191"), ("SVI", "0191"), ("MEW", "1")]
+        bulk = db.get_cards_bulk(pairs)
+        assert set(bulk) == set(pairs)
+        for pair in pairs:
+            assert bulk[pair] == db.get_card(*pair)
+        assert bulk[("MEW", "1")] is None
+
+    def test_empty_pairs(self):
+        assert self._db([("iono", "PAL", "185", "Uncommon")]).get_cards_bulk([]) == {}
+
+
+class TestDecklistSections:
+    def test_matches_substring_rule(self):
+        headings = ["Pokémon (17)", "Trainer (35)", "Energy (8)", "TRAINERS", "Special Energy",
+                    "Pokemon", "", "Trainer / Energy", "Items"]
+        for heading in headings:
+            lowered = heading.lower()
+            expected = "trainer" not in lowered and "energy" not in lowered
+            assert shared._is_pokemon_section(heading) is expected
@@ -13,11 +13,12 @@ the ptcg-symbol energy type letter for each card, then patches:
 import json
 import os
 import sys
-import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 # Add backend/core to path so we can import shared utilities
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend", "core"))
-from card_scraper_shared import safe_fetch_html
+from card_scraper_shared import safe_fetch_html, RequestPacer
 from bs4 import BeautifulSoup
 
 # Limitless ptcg-symbol letter -> TCG energy type name
@@ -29,18 +30,49 @@ ENERGY_SYMBOL_MAP = {
 
 DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
 
+LIST_URL = "https://limitlesstcg.com/cards?q=lang%3Aen&display=list"
+PAGES_IN_FLIGHT = 3
+REQUEST_SPACING = 0.3  # seconds between request starts, across all workers
+
+_pacer = RequestPacer(REQUEST_SPACING)
+
+
+def _page_url(page):
+    return LIST_URL if page == 1 else f"{LIST_URL}&page={page}"
+
+
+def _fetch_paced(url):
+    """safe_fetch_html, spacing request starts REQUEST_SPACING apart globally."""
+    _pacer.wait()
+    return safe_fetch_html(url, timeout=30, retries=3)
+
 
 def scrape_energy_types():
-    """Scrape Limitless list pages and return {set::number: energy_type} mapping."""
-    base_url = "https://limitlesstcg.com/cards?q=lang%3Aen&display=list"
+    """Scrape Limitless list pages and return {set::number: energy_type} mapping.
+
+    The next few pages are already downloading while the current one is
+    parsed; pages are still processed strictly in order.
+    """
     energy_map = {}
-    page = 1
+    with ThreadPoolExecutor(max_workers=PAGES_IN_FLIGHT) as executor:
+        pending = deque(executor.submit(_fetch_paced, _page_url(p)) for p in range(1, PAGES_IN_FLIGHT + 1))
+        try:
+            _collect_energy_types(executor, pending, energy_map)
+        finally:
+            for future in pending:
+                future.cancel()
 
+    print(f"\n✓ {len(energy_map)} Energy Types extrahiert.")
+    return energy_map
+
+
+def _collect_energy_types(executor, pending, energy_map):
+    page = 1
     while True:
-        url = base_url if page == 1 else f"{base_url}&page={page}"
-        print(f"  Seite {page}: {url}")
+        print(f"  Seite {page}: {_page_url(page)}")
 
-        html = safe_fetch_html(url, timeout=30, retries=3)
+        html = pending.popleft().result()
+        pending.append(executor.submit(_fetch_paced, _page_url(page + PAGES_IN_FLIGHT)))
         if not html:
             print(f"  Kein HTML erhalten - Stoppe.")
             break
@@ -90,10 +122,6 @@ def scrape_energy_types():
             break
 
         page += 1
-        time.sleep(0.3)
-
-    print(f"\n✓ {len(energy_map)} Energy Types extrahiert.")
-    return energy_map
 
 
 def patch_json_file(filepath, energy_map):
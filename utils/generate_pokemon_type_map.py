@@ -3,8 +3,9 @@ Generate a static JSON mapping from Pokedex number to TCG energy type.
 Uses PokeAPI to fetch the primary type for each Pokemon (1-1025).
 Maps game types to TCG energy types.
 """
+import gzip
+import http.client
 import json
-import urllib.request
 import time
 import sys
 
@@ -29,17 +30,41 @@ GAME_TO_TCG = {
     'fairy': 'Psychic',    # Fairy type merged into Psychic in modern TCG
 }
 
+API_HOST = 'pokeapi.co'
+_conn = None
+
+
+def _get_json(path):
+    """GET path from PokeAPI over one reused keep-alive HTTPS connection."""
+    global _conn
+    if _conn is None:
+        _conn = http.client.HTTPSConnection(API_HOST, timeout=10)
+    try:
+        _conn.request('GET', path, headers={'User-Agent': 'Pokemon-TCG-Analysis/1.0',
+                                            'Accept-Encoding': 'gzip'})
+        resp = _conn.getresponse()
+        # Read the body to the end so the connection can serve the next request
+        raw = resp.read()
+    except Exception:
+        _conn.close()
+        _conn = None  # reconnect on the next attempt
+        raise
+    if resp.status != 200:
+        raise http.client.HTTPException(f'HTTP {resp.status} {resp.reason}')
+    if resp.getheader('Content-Encoding') == 'gzip':
+        raw = gzip.decompress(raw)
+    return json.loads(raw)
+
+
 def fetch_pokemon_type(dex_number, retries=3):
-    url = f'https://pokeapi.co/api/v2/pokemon/{dex_number}'
+    path = f'/api/v2/pokemon/{dex_number}'
     for attempt in range(retries):
         try:
-            req = urllib.request.Request(url, headers={'User-Agent': 'Pokemon-TCG-Analysis/1.0'})
-            with urllib.request.urlopen(req, timeout=10) as resp:
-                data = json.loads(resp.read())
-                types = sorted(data.get('types', []), key=lambda t: t.get('slot', 99))
-                if types:
-                    primary_type = types[0]['type']['name']
-                    return GAME_TO_TCG.get(primary_type, 'Colorless')
+            data = _get_json(path)
+            types = sorted(data.get('types', []), key=lambda t: t.get('slot', 99))
+            if types:
+                primary_type = types[0]['type']['name']
+                return GAME_TO_TCG.get(primary_type, 'Colorless')
         except Exception as e:
             if attempt < retries - 1:
                 time.sleep(1)
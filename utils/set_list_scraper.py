@@ -11,27 +11,152 @@ Run this whenever a new set is released to update the SET_ORDER mapping.
 
 OPTIMIZATION: Only re-scrapes full list if a new set is detected (2-3 sec vs 10-20 sec).
 
-DEPRECATION NOTICE:
-  This script still uses Selenium (headless Chrome). The main production
-  scrapers have been migrated to cloudscraper + BeautifulSoup.
-  Consider migrating this utility to cloudscraper as well.
+FETCHING:
+  The set table is read from the server-rendered HTML via cloudscraper +
+  BeautifulSoup (card_scraper_shared), like the production scrapers.
+  Selenium (headless Chrome) is only started as a fallback when that HTML
+  carries no row text, e.g. if Limitless switches the table to JS rendering.
 """
 
 import csv
 import os
+import re
+import sys
 from pathlib import Path
 from datetime import datetime
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 import time
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend", "core"))
+from card_scraper_shared import BeautifulSoup, safe_fetch_html
+
+try:
+    from selenium import webdriver
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+except ModuleNotFoundError:
+    webdriver = None  # only needed for the browser fallback
+
 # Settings
 BASE_URL = "https://limitlesstcg.com/cards"
 OUTPUT_CSV = "data/pokemon_sets_list.csv"
 OUTPUT_JS = "data/pokemon_sets_order.js"
 
+# Reads every set row of the table in one WebDriver round trip instead of
+# several find_element(s) calls per row.
+# Each entry: [href, link text, first cell text, release date, card count]
+ROWS_JS = """
+return Array.from(document.querySelectorAll('table tbody tr')).map(tr => {
+    const tds = tr.querySelectorAll('td');
+    if (tds.length < 2) return null;
+    const link = tds[0].querySelector('a');
+    if (!link) return null;
+    return [
+        link.href || '',
+        link.innerText.trim(),
+        tds[0].innerText.trim(),
+        tds[1].innerText.trim(),
+        tds.length > 2 ? tds[2].innerText.trim() : '',
+    ];
+}).filter(Boolean);
+"""
+
+# Era headings for the generated JS mapping, checked in order (first match wins)
+MEGA_SET_CODES = frozenset({'ASC', 'PFL', 'MEG', 'MEE', 'MEP'})
+ERA_RULES = (
+    ("Mega", re.compile(r'Mega')),
+    ("Scarlet & Violet", re.compile(r'Scarlet|Violet|Prismatic|Surging|Stellar')),
+    ("Sword & Shield", re.compile(r'Sword|Shield|Crown|Silver|Lost')),
+    ("Sun & Moon", re.compile(r'Sun|Moon|Cosmic|Hidden|Unified')),
+    ("XY", re.compile(r'^XY|Evolution|Steam')),
+    ("Black & White", re.compile(r'Black|White|Plasma')),
+    ("HeartGold & SoulSilver", re.compile(r'HeartGold|SoulSilver|Call of Legends')),
+    ("Diamond & Pearl", re.compile(r'Diamond|Pearl|Platinum')),
+)
+
+def detect_era(set_code, set_name):
+    """Era heading a set is grouped under in the generated SET_ORDER mapping."""
+    if set_code in MEGA_SET_CODES:
+        return "Mega"
+    return next((era for era, pattern in ERA_RULES if pattern.search(set_name)), "Classic")
+
+def set_code_from_href(href):
+    """'https://limitlesstcg.com/cards/ASC?x' -> 'ASC' ('' for non-set links)."""
+    if '/cards/' not in href:
+        return ''
+    return href.rstrip('/').split('/cards/')[-1].split('/')[0].split('?')[0].upper()
+
+def read_set_rows(driver):
+    """Return (set_code, link_text, cell_text, release_date, card_count) for each set row on the page."""
+    rows = []
+    for href, link_text, cell_text, release_date, card_count in driver.execute_script(ROWS_JS) or []:
+        set_code = set_code_from_href(href)
+        if set_code:
+            rows.append((set_code, link_text, cell_text, release_date, card_count))
+    return rows
+
+def fetch_set_rows_http():
+    """Same rows as read_set_rows, parsed from the plain HTML page (no browser).
+
+    Returns [] if the page could not be fetched or its rows carry no text.
+    """
+    if BeautifulSoup is None:
+        return []
+    html = safe_fetch_html(BASE_URL, quiet=True)
+    if not html:
+        return []
+    
+    rows = []
+    for tr in BeautifulSoup(html, 'lxml').select('table tbody tr'):
+        cells = tr.find_all('td')
+        if len(cells) < 2:
+            continue
+        link = cells[0].find('a')
+        if link is None:
+            continue
+        set_code = set_code_from_href(link.get('href') or '')
+        if not set_code:
+            continue
+        rows.append((
+            set_code,
+            link.get_text(' ', strip=True),
+            cells[0].get_text('\n', strip=True),
+            cells[1].get_text(' ', strip=True),
+            cells[2].get_text(' ', strip=True) if len(cells) > 2 else '',
+        ))
+    
+    if not any(cell_text for _, _, cell_text, _, _ in rows):
+        return []
+    return rows
+
+def merge_set_rows(rows, collected, row_order):
+    """Merge scraped rows into collected (set_code -> data), keeping the best non-empty values."""
+    for set_code, _, cell_text, release_date, card_count in rows:
+        # Extract name: split cell text by newlines, discard the set-code line
+        name_lines = [
+            l.strip() for l in cell_text.split('\n')
+            if l.strip() and l.strip().upper() != set_code
+        ]
+        set_name = name_lines[0] if name_lines else ''
+        
+        existing = collected.get(set_code)
+        # Update if we have no entry yet, or if this one has better (non-empty) data
+        if not existing:
+            collected[set_code] = {
+                'set_code': set_code,
+                'set_name': set_name,
+                'release_date': release_date,
+                'card_count': card_count,
+            }
+            row_order.append(set_code)
+        else:
+            if set_name and not existing['set_name']:
+                existing['set_name'] = set_name
+            if release_date and not existing['release_date']:
+                existing['release_date'] = release_date
+            if card_count and not existing['card_count']:
+                existing['card_count'] = card_count
+
 def load_existing_sets():
     """Load existing set list from CSV."""
     if not os.path.exists(OUTPUT_CSV):
@@ -47,89 +172,77 @@ def load_existing_sets():
         print(f"[Set Scraper] Error loading existing CSV: {e}")
         return []
 
-def scrape_newest_set_only():
+class BrowserSession:
+    """Lazily started Chrome driver shared by the quick check and the full scrape.
+    
+    Chrome is only launched the first time get() is called, so runs served by
+    the plain HTML fetch never start a browser at all.
+    """
+    
+    def __init__(self):
+        self.driver = None
+    
+    def get(self):
+        if self.driver is None:
+            print("[Set Scraper] Starting browser...")
+            options = webdriver.ChromeOptions()
+            options.add_argument('--headless')
+            options.add_argument('--disable-gpu')
+            options.add_argument('--no-sandbox')
+            options.add_argument('--disable-dev-shm-usage')
+            options.add_argument('--window-size=1920,1080')
+            
+            self.driver = webdriver.Chrome(options=options)
+            self.driver.set_page_load_timeout(60)
+        return self.driver
+    
+    def quit(self):
+        if self.driver is not None:
+            self.driver.quit()
+            self.driver = None
+
+def scrape_newest_set_only(browser=None):
     """Scrape only the newest (first) set to check for changes."""
     print("[Set Scraper] 🔍 Quick check: Scraping newest set only...")
     
-    options = webdriver.ChromeOptions()
-    options.add_argument('--headless')
-    options.add_argument('--disable-gpu')
-    options.add_argument('--no-sandbox')
-    options.add_argument('--disable-dev-shm-usage')
-    
-    driver = webdriver.Chrome(options=options)
-    driver.set_page_load_timeout(30)
+    rows = fetch_set_rows_http()
+    if not rows and webdriver is not None:
+        print("[Set Scraper] HTML table empty - falling back to browser...")
+        own_browser = browser is None
+        if own_browser:
+            browser = BrowserSession()
+        
+        try:
+            driver = browser.get()
+            driver.get(BASE_URL)
+            wait = WebDriverWait(driver, 15)
+            wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "table tbody tr")))
+            time.sleep(2)
+            rows = read_set_rows(driver)
+        except Exception as e:
+            print(f"[Set Scraper] Error checking newest set: {e}")
+        finally:
+            if own_browser:
+                browser.quit()
     
     newest_set = None
-    
-    try:
-        driver.get(BASE_URL)
-        wait = WebDriverWait(driver, 15)
-        wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "table tbody tr")))
-        time.sleep(2)
-        
-        rows = driver.find_elements(By.CSS_SELECTOR, "table tbody tr")
-        for row in rows:
-            try:
-                cells = row.find_elements(By.TAG_NAME, "td")
-                if len(cells) < 2:
-                    continue
-                links = cells[0].find_elements(By.TAG_NAME, "a")
-                if not links:
-                    continue
-                href = links[0].get_attribute("href") or ''
-                if '/cards/' not in href:
-                    continue
-                set_code = href.rstrip('/').split('/cards/')[-1].split('/')[0].split('?')[0].upper()
-                if not set_code:
-                    continue
-                full_name = links[0].text.strip() or cells[0].text.strip()
-                set_name = full_name
-                if full_name.upper().startswith(set_code):
-                    set_name = full_name[len(set_code):].strip()
-                release_date = cells[1].text.strip() if len(cells) > 1 else ''
-                newest_set = {'set_code': set_code, 'set_name': set_name, 'release_date': release_date}
-                print(f"[Set Scraper] Newest set on Limitless: {set_code} - {set_name} ({release_date})")
-                break
-            except Exception:
-                continue
-    except Exception as e:
-        print(f"[Set Scraper] Error checking newest set: {e}")
-    finally:
-        driver.quit()
+    for set_code, link_text, cell_text, release_date, _ in rows[:1]:
+        full_name = link_text or cell_text
+        set_name = full_name
+        if full_name.upper().startswith(set_code):
+            set_name = full_name[len(set_code):].strip()
+        newest_set = {'set_code': set_code, 'set_name': set_name, 'release_date': release_date}
+        print(f"[Set Scraper] Newest set on Limitless: {set_code} - {set_name} ({release_date})")
     
     return newest_set
 
-def scrape_set_list():
-    """Scrape all Pokemon TCG sets from Limitless.
+def scrape_set_list_browser(driver, collected, row_order):
+    """Browser fallback: scroll through the lazily rendered table and merge rows into collected.
     
-    Limitless uses virtual/lazy rendering - row text is only populated when the
-    row is in the viewport.  We solve this by scrolling in small steps and
-    collecting data at each position, keeping the best (non-empty) value seen.
+    With virtual/lazy rendering, row text is only populated when the row is in
+    the viewport.  We solve this by scrolling in small steps and collecting
+    data at each position, keeping the best (non-empty) value seen.
     """
-    
-    print("=" * 80)
-    print("POKEMON TCG SET LIST SCRAPER")
-    print("=" * 80)
-    print()
-    print(f"Source: {BASE_URL}")
-    print(f"Output: {OUTPUT_CSV}")
-    print()
-    
-    print("[Set Scraper] Starting browser...")
-    options = webdriver.ChromeOptions()
-    options.add_argument('--headless')
-    options.add_argument('--disable-gpu')
-    options.add_argument('--no-sandbox')
-    options.add_argument('--disable-dev-shm-usage')
-    options.add_argument('--window-size=1920,1080')
-    
-    driver = webdriver.Chrome(options=options)
-    driver.set_page_load_timeout(60)
-    
-    collected = {}   # set_code -> best data seen so far
-    row_order = []   # maintains insertion order for final sort
-    
     try:
         print(f"[Set Scraper] Loading {BASE_URL}...")
         driver.get(BASE_URL)
@@ -148,54 +261,7 @@ def scrape_set_list():
             driver.execute_script(f"window.scrollTo(0, {pos});")
             time.sleep(0.5)
             
-            rows = driver.find_elements(By.CSS_SELECTOR, "table tbody tr")
-            for row in rows:
-                try:
-                    cells = row.find_elements(By.TAG_NAME, "td")
-                    if len(cells) < 2:
-                        continue
-                    links = cells[0].find_elements(By.TAG_NAME, "a")
-                    if not links:
-                        continue
-                    
-                    href = links[0].get_attribute("href") or ''
-                    if '/cards/' not in href:
-                        continue
-                    set_code = href.rstrip('/').split('/cards/')[-1].split('/')[0].split('?')[0].upper()
-                    if not set_code:
-                        continue
-                    
-                    # Extract name: split cell text by newlines, discard the set-code line
-                    cell_text = cells[0].text.strip()
-                    name_lines = [
-                        l.strip() for l in cell_text.split('\n')
-                        if l.strip() and l.strip().upper() != set_code
-                    ]
-                    set_name = name_lines[0] if name_lines else ''
-                    
-                    release_date = cells[1].text.strip() if len(cells) > 1 else ''
-                    card_count  = cells[2].text.strip() if len(cells) > 2 else ''
-                    
-                    existing = collected.get(set_code)
-                    # Update if we have no entry yet, or if this one has better (non-empty) data
-                    if not existing:
-                        collected[set_code] = {
-                            'set_code': set_code,
-                            'set_name': set_name,
-                            'release_date': release_date,
-                            'card_count': card_count,
-                        }
-                        row_order.append(set_code)
-                    else:
-                        if set_name and not existing['set_name']:
-                            existing['set_name'] = set_name
-                        if release_date and not existing['release_date']:
-                            existing['release_date'] = release_date
-                        if card_count and not existing['card_count']:
-                            existing['card_count'] = card_count
-                            
-                except Exception:
-                    continue
+            merge_set_rows(read_set_rows(driver), collected, row_order)
             
             page_height = driver.execute_script("return document.body.scrollHeight")
             pos += step
@@ -206,42 +272,51 @@ def scrape_set_list():
         # One final pass at the very bottom
         driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
         time.sleep(1)
-        rows = driver.find_elements(By.CSS_SELECTOR, "table tbody tr")
-        for row in rows:
-            try:
-                cells = row.find_elements(By.TAG_NAME, "td")
-                if len(cells) < 2:
-                    continue
-                links = cells[0].find_elements(By.TAG_NAME, "a")
-                if not links:
-                    continue
-                href = links[0].get_attribute("href") or ''
-                if '/cards/' not in href:
-                    continue
-                set_code = href.rstrip('/').split('/cards/')[-1].split('/')[0].split('?')[0].upper()
-                if not set_code or set_code not in collected:
-                    continue
-                existing = collected[set_code]
-                cell_text = cells[0].text.strip()
-                name_lines = [l.strip() for l in cell_text.split('\n') if l.strip() and l.strip().upper() != set_code]
-                if name_lines and not existing['set_name']:
-                    existing['set_name'] = name_lines[0]
-                if len(cells) > 1 and cells[1].text.strip() and not existing['release_date']:
-                    existing['release_date'] = cells[1].text.strip()
-            except Exception:
-                continue
+        merge_set_rows(
+            [row for row in read_set_rows(driver) if row[0] in collected],
+            collected, row_order,
+        )
         
         print(f"[Set Scraper] Extracting set data (collected during {passes} scroll passes)...")
+        return True
     
     except Exception as e:
         print(f"[Set Scraper] ERROR: {e}")
         import traceback
         traceback.print_exc()
-        driver.quit()
-        return []
+        return False
+
+def scrape_set_list(browser=None):
+    """Scrape all Pokemon TCG sets from Limitless."""
     
-    finally:
-        driver.quit()
+    print("=" * 80)
+    print("POKEMON TCG SET LIST SCRAPER")
+    print("=" * 80)
+    print()
+    print(f"Source: {BASE_URL}")
+    print(f"Output: {OUTPUT_CSV}")
+    print()
+    
+    collected = {}   # set_code -> best data seen so far
+    row_order = []   # maintains insertion order for final sort
+    
+    rows = fetch_set_rows_http()
+    if rows:
+        print(f"[Set Scraper] Read {len(rows)} rows from HTML (no browser needed)")
+        merge_set_rows(rows, collected, row_order)
+    elif webdriver is None:
+        print("[Set Scraper] ERROR: HTML table empty and selenium is not installed")
+        return []
+    else:
+        own_browser = browser is None
+        if own_browser:
+            browser = BrowserSession()
+        try:
+            if not scrape_set_list_browser(browser.get(), collected, row_order):
+                return []
+        finally:
+            if own_browser:
+                browser.quit()
     
     # Build final list preserving page order; assign order numbers (newest = highest)
     sets = []
@@ -285,51 +360,27 @@ def generate_javascript_mapping(sets):
     # Sort by order (highest first)
     sets_sorted = sorted(sets, key=lambda x: x['order'], reverse=True)
     
-    js_lines = [
+    entries = [(s['set_code'], s['order'], s['set_name']) for s in sets_sorted]
+    eras = [detect_era(code, name) for code, _, name in entries]
+    
+    header = "\n".join([
         "// Pokemon TCG Set Order Mapping",
         f"// Auto-generated from Limitless TCG on {datetime.now().strftime('%Y-%m-%d %H:%M')}",
         "// Higher number = newer set",
         "",
         "const SET_ORDER = {"
-    ]
+    ])
     
-    # Group by era for readability
-    current_era = None
-    for s in sets_sorted:
-        set_name = s['set_name']
-        
-        # Detect era changes
-        era = None
-        if 'Mega' in set_name or s['set_code'] in ['ASC', 'PFL', 'MEG', 'MEE', 'MEP']:
-            era = "Mega"
-        elif any(x in set_name for x in ['Scarlet', 'Violet', 'Prismatic', 'Surging', 'Stellar']):
-            era = "Scarlet & Violet"
-        elif any(x in set_name for x in ['Sword', 'Shield', 'Crown', 'Silver', 'Lost']):
-            era = "Sword & Shield"
-        elif any(x in set_name for x in ['Sun', 'Moon', 'Cosmic', 'Hidden', 'Unified']):
-            era = "Sun & Moon"
-        elif set_name.startswith('XY') or 'Evolution' in set_name or 'Steam' in set_name:
-            era = "XY"
-        elif any(x in set_name for x in ['Black', 'White', 'Plasma']):
-            era = "Black & White"
-        elif any(x in set_name for x in ['HeartGold', 'SoulSilver', 'Call of Legends']):
-            era = "HeartGold & SoulSilver"
-        elif any(x in set_name for x in ['Diamond', 'Pearl', 'Platinum']):
-            era = "Diamond & Pearl"
-        else:
-            era = "Classic"
-        
-        if era != current_era:
-            if current_era is not None:
-                js_lines.append("")
-            js_lines.append(f"    // {era}")
-            current_era = era
-        
-        js_lines.append(f"    '{s['set_code']}': {s['order']},  // {set_name}")
-    
-    js_lines.append("};")
+    # Group by era for readability: an era comment (preceded by a blank line
+    # after the first group) opens each run of sets from the same era.
+    rows = [f"    '{code}': {order},  // {name}" for code, order, name in entries]
+    body = "\n".join([
+        row if i and era == eras[i - 1]
+        else ("\n" if i else "") + f"    // {era}\n{row}"
+        for i, (era, row) in enumerate(zip(eras, rows))
+    ])
     
-    js_content = "\n".join(js_lines)
+    js_content = f"{header}\n{body}\n}};"
     
     with open(OUTPUT_JS, 'w', encoding='utf-8') as f:
         f.write(js_content)
@@ -349,12 +400,22 @@ def main():
     print(f"Output: {OUTPUT_CSV}")
     print()
     
+    # One browser session for the whole run - only started if the HTML fetch fails
+    browser = BrowserSession()
+    try:
+        run(browser)
+    finally:
+        browser.quit()
+
+def run(browser):
+    """Quick newest-set check, then a full scrape if needed."""
+    
     # Step 1: Load existing sets
     existing_sets = load_existing_sets()
     
     if existing_sets:
         # Step 2: Quick check - scrape only newest set
-        newest_set = scrape_newest_set_only()
+        newest_set = scrape_newest_set_only(browser)
         
         if newest_set:
             # Step 3: Compare with existing newest set
@@ -385,7 +446,7 @@ def main():
                 print()
     
     # Step 4: Full scrape (either first run or new set detected)
-    sets = scrape_set_list()
+    sets = scrape_set_list(browser)
     
     if sets:
         save_sets_to_csv(sets)
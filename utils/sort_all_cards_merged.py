@@ -7,51 +7,62 @@ Automatically runs after all_cards_scraper finishes.
 """
 
 import csv
-import json
 import os
 import sys
 from datetime import datetime
+from operator import itemgetter
 
 # Allow importing from project root
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-from card_scraper_shared import load_set_order, extract_number, card_sort_key
+from card_scraper_shared import (
+    load_set_order, sort_by_set_and_number,
+    read_json, write_json, atomic_write_file, read_csv_rows,
+)
 
 SET_ORDER = load_set_order()
 
-def sort_key(card):
-    return card_sort_key(card, SET_ORDER)
-
 def sort_csv():
     """Sort the CSV file."""
     csv_path = 'data/all_cards_merged.csv'
     
-    if not os.path.exists(csv_path):
+    try:
+        f = open(csv_path, 'r', encoding='utf-8-sig', newline='', buffering=1 << 20)
+    except FileNotFoundError:
         print(f"[WARN] {csv_path} not found, skipping CSV sort")
         return 0
     
     print(f"\n[CSV] Loading {csv_path}...")
-    cards = []
-    fieldnames = None
     
-    with open(csv_path, 'r', encoding='utf-8-sig', newline='') as f:
-        reader = csv.DictReader(f)
-        fieldnames = reader.fieldnames
-        for row in reader:
-            cards.append(row)
+    # Plain list rows: no dict per card on read, and the writer emits each row
+    # as-is instead of looking every field up by name again.
+    with f:
+        fieldnames, cards = read_csv_rows(f)
     
     print(f"[CSV] Loaded {len(cards)} cards")
     
-    # Sort: First by SET_ORDER (newest first), then by number (numerically)
-    cards.sort(key=sort_key)
+    missing = [col for col in ('set', 'number') if col not in fieldnames]
+    if missing:
+        print(f"[ERROR] {csv_path} has no {'/'.join(missing)} column, skipping CSV sort")
+        return 0
+    set_idx = fieldnames.index('set')
+    num_idx = fieldnames.index('number')
+    
+    # Sort: First by SET_ORDER (newest first), then by number (numerically).
+    # Re-runs without new cards are usually already in order: skip the rewrite.
+    if not sort_by_set_and_number(cards, SET_ORDER, itemgetter(set_idx), itemgetter(num_idx)):
+        print("[CSV] Already sorted, skipping rewrite")
+        return len(cards)
     
     print(f"[CSV] Sorted by Release Date (SET_ORDER) → Number")
     
     # Save back
-    with open(csv_path, 'w', encoding='utf-8', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
+    def _write_csv(out):
+        writer = csv.writer(out)
+        writer.writerow(fieldnames)
         writer.writerows(cards)
     
+    atomic_write_file(csv_path, _write_csv, encoding='utf-8', newline='', buffering=1 << 20)
+    
     print(f"[CSV] ✓ Saved sorted CSV")
     return len(cards)
 
@@ -59,13 +70,13 @@ def sort_json():
     """Sort the JSON file."""
     json_path = 'data/all_cards_merged.json'
     
-    if not os.path.exists(json_path):
+    try:
+        data = read_json(json_path)
+    except FileNotFoundError:
         print(f"[WARN] {json_path} not found, skipping JSON sort")
         return 0
     
-    print(f"\n[JSON] Loading {json_path}...")
-    with open(json_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    print(f"\n[JSON] Loaded {json_path}")
     
     # Handle nested structure with "cards" array
     if isinstance(data, dict) and 'cards' in data:
@@ -77,8 +88,12 @@ def sort_json():
     
     print(f"[JSON] Loaded {len(cards)} cards")
     
-    # Sort: First by SET_ORDER (newest first), then by number (numerically)
-    cards.sort(key=sort_key)
+    # Sort: First by SET_ORDER (newest first), then by number (numerically).
+    # Re-runs without new cards are usually already in order: skip the rewrite.
+    if not sort_by_set_and_number(cards, SET_ORDER,
+                                  lambda c: c.get('set', ''), lambda c: c.get('number', '0')):
+        print("[JSON] Already sorted, skipping rewrite")
+        return len(cards)
     
     print(f"[JSON] Sorted by Set → Number")
     
@@ -92,8 +107,7 @@ def sort_json():
         save_data = cards
     
     # Save back
-    with open(json_path, 'w', encoding='utf-8') as f:
-        json.dump(save_data, f, ensure_ascii=False, indent=2)
+    write_json(json_path, save_data)
     
     print(f"[JSON] ✓ Saved sorted JSON")
     return len(cards)
@@ -8,20 +8,20 @@ Fixes the problem where SVI/WHI/FST/MEE/SVE cards are mixed up.
 """
 
 import csv
-import json
 import os
 import sys
 from datetime import datetime
+from operator import itemgetter
 
 # Allow importing from project root
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-from card_scraper_shared import load_set_order, extract_number, card_sort_key
+from card_scraper_shared import (
+    load_set_order, sort_by_set_and_number,
+    read_json, write_json, atomic_write_file, read_csv_rows,
+)
 
 SET_ORDER = load_set_order()
 
-def sort_key(card):
-    return card_sort_key(card, SET_ORDER)
-
 
 def main():
     print("=" * 80)
@@ -31,50 +31,65 @@ def main():
 
     # Load CSV
     csv_path = 'data/all_cards_database.csv'
-    if not os.path.exists(csv_path):
+    try:
+        f = open(csv_path, 'r', encoding='utf-8-sig', newline='', buffering=1 << 20)
+    except FileNotFoundError:
         print(f"ERROR: {csv_path} not found!")
         exit(1)
 
+    # Rows stay plain lists (no per-row dict) and are sorted on the set/number
+    # columns only, which keeps memory close to the size of the file itself.
     print(f"Loading {csv_path}...")
-    cards = []
-    with open(csv_path, 'r', encoding='utf-8-sig', newline='') as f:
-        reader = csv.DictReader(f)
-        fieldnames = reader.fieldnames
-        cards = list(reader)
+    with f:
+        fieldnames, cards = read_csv_rows(f)
 
     print(f"✓ Loaded {len(cards)} cards")
 
+    missing = [col for col in ('set', 'number', 'name') if col not in fieldnames]
+    if missing:
+        print(f"ERROR: {csv_path} has no {'/'.join(missing)} column!")
+        exit(1)
+    set_idx = fieldnames.index('set')
+    num_idx = fieldnames.index('number')
+    name_idx = fieldnames.index('name')
+
     # Sort cards
     print("Sorting by SET_ORDER (newest sets first) and card number...")
-    cards.sort(key=sort_key)
+    sort_by_set_and_number(cards, SET_ORDER, itemgetter(set_idx), itemgetter(num_idx))
     print("✓ Cards sorted")
 
     # Show sample of sorted order
     print("\nFirst 10 cards after sorting:")
     for i, card in enumerate(cards[:10], 1):
-        set_order = SET_ORDER.get(card['set'], 0)
-        print(f"  {i}. {card['name']} ({card['set']} {card['number']}) - Order: {set_order}")
+        set_order = SET_ORDER.get(card[set_idx], 0)
+        print(f"  {i}. {card[name_idx]} ({card[set_idx]} {card[num_idx]}) - Order: {set_order}")
 
     print("\nLast 10 cards after sorting:")
     for i, card in enumerate(cards[-10:], len(cards)-9):
-        set_order = SET_ORDER.get(card['set'], 0)
-        print(f"  {i}. {card['name']} ({card['set']} {card['number']}) - Order: {set_order}")
+        set_order = SET_ORDER.get(card[set_idx], 0)
+        print(f"  {i}. {card[name_idx]} ({card[set_idx]} {card[num_idx]}) - Order: {set_order}")
 
-    # Save sorted CSV
+    # Save sorted CSV (temp file + rename, so an interrupted run can't truncate the database)
     print(f"\nSaving sorted CSV to {csv_path}...")
-    with open(csv_path, 'w', encoding='utf-8', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
+
+    def _write_csv(out):
+        writer = csv.writer(out)
+        writer.writerow(fieldnames)
         writer.writerows(cards)
 
+    atomic_write_file(csv_path, _write_csv, encoding='utf-8', newline='', buffering=1 << 20)
+
     print("✓ Saved CSV")
 
     # Sort JSON too
     json_path = 'data/all_cards_database.json'
-    if os.path.exists(json_path):
-        print(f"\nLoading {json_path}...")
-        with open(json_path, 'r', encoding='utf-8') as f:
-            json_data = json.load(f)
+    try:
+        json_data = read_json(json_path)
+    except FileNotFoundError:
+        json_data = None
+
+    if json_data is not None:
+        print(f"\nLoaded {json_path}")
 
         if isinstance(json_data, dict) and 'cards' in json_data:
             json_cards = json_data['cards']
@@ -85,7 +100,8 @@ def main():
 
         print(f"✓ Loaded {len(json_cards)} cards from JSON")
         print("Sorting JSON...")
-        json_cards.sort(key=sort_key)
+        sort_by_set_and_number(json_cards, SET_ORDER,
+                               lambda c: c.get('set', ''), lambda c: c.get('number', '0'))
         print("✓ JSON sorted")
 
         if has_metadata:
@@ -97,8 +113,7 @@ def main():
             save_data = json_cards
 
         print(f"Saving sorted JSON to {json_path}...")
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(save_data, f, ensure_ascii=False, indent=2)
+        write_json(json_path, save_data)
         print("✓ Saved JSON")
     else:
         print(f"\n⚠ {json_path} not found, skipping JSON sort")